@@ -1,34 +1,106 @@
-from flask import Flask, render_template, request, jsonify
+from quart import Quart, Response, render_template, request, jsonify
+from quart.json.provider import JSONProvider
+from quart.wrappers.response import DataBody
 from datetime import datetime, timedelta
+import asyncio
+import gzip
 import os
+from collections import Counter
+from cachetools import TTLCache
+from quart_rate_limiter import RateLimiter, RateLimit, rate_limit
+from config import Config
 from src.news_fetcher import NewsFetcher
 from src.sentiment_analyzer import SentimentAnalyzer
 from src.data_manager import DataManager
 from src.visualizer import create_sentiment_chart, create_trend_chart
 import logging
+import orjson
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-app = Flask(__name__)
+class ORJSONProvider(JSONProvider):
+    """JSON provider that serializes responses with orjson"""
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+app = Quart(__name__)
+app.json = ORJSONProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('SECRET_KEY', 'dev-secret-key')
 
+# Rate limiting (per client address); use Redis to share counters across workers
+rate_limit_store = None
+if Config.RATE_LIMIT_STORAGE_URL:
+    from quart_rate_limiter.redis_store import RedisStore
+    rate_limit_store = RedisStore(Config.RATE_LIMIT_STORAGE_URL)
+rate_limiter = RateLimiter(
+    app,
+    store=rate_limit_store,
+    default_limits=[RateLimit(Config.REQUESTS_PER_MINUTE, timedelta(minutes=1))]
+)
+
 # Initialize components
 news_fetcher = NewsFetcher()
 sentiment_analyzer = SentimentAnalyzer()
 data_manager = DataManager()
 
+# Recent /api/analyze responses keyed by (keywords, sources, limit). Routes run on
+# a single event loop, so the cache is only touched from one thread.
+analyze_cache = TTLCache(maxsize=512, ttl=Config.CACHE_TIMEOUT)
+
+@app.after_serving
+async def close_connections():
+    """Release pooled HTTP connections and worker processes on shutdown"""
+    news_fetcher.close()
+    sentiment_analyzer.close()
+
+@app.after_request
+async def compress_response(response):
+    """Compress JSON responses for clients that accept brotli or gzip"""
+    # Streamed bodies (exports) and already-encoded responses are left alone
+    if (response.mimetype != 'application/json'
+            or not isinstance(response.response, DataBody)
+            or 'Content-Encoding' in response.headers):
+        return response
+    
+    data = await response.get_data()
+    if len(data) < Config.COMPRESS_MIN_SIZE:
+        return response
+    
+    accept_encoding = request.headers.get('Accept-Encoding', '').lower()
+    if brotli is not None and 'br' in accept_encoding:
+        response.set_data(brotli.compress(data, quality=Config.COMPRESS_LEVEL))
+        response.headers['Content-Encoding'] = 'br'
+    elif 'gzip' in accept_encoding:
+        response.set_data(gzip.compress(data, compresslevel=Config.COMPRESS_LEVEL))
+        response.headers['Content-Encoding'] = 'gzip'
+    else:
+        return response
+    
+    response.vary.add('Accept-Encoding')
+    return response
+
 @app.route('/')
-def index():
+async def index():
     """Main dashboard page"""
-    return render_template('index.html')
+    return await render_template('index.html')
 
 @app.route('/api/analyze', methods=['POST'])
-def analyze_news():
+@rate_limit(20, timedelta(minutes=1))
+async def analyze_news():
     """Analyze news sentiment for given keywords"""
     try:
-        data = request.get_json()
+        data = await request.get_json()
         keywords = data.get('keywords', '')
         sources = data.get('sources', ['newsapi'])
         limit = data.get('limit', 10)
@@ -36,79 +108,119 @@ def analyze_news():
         if not keywords:
             return jsonify({'error': 'Keywords are required'}), 400
         
+        cache_key = (keywords, tuple(sources), limit)
+        if cache_key in analyze_cache:
+            logger.info(f"Serving cached analysis for keywords: {keywords}")
+            return jsonify(analyze_cache[cache_key])
+        
         # Fetch news articles
         logger.info(f"Fetching news for keywords: {keywords}")
-        articles = news_fetcher.fetch_news(keywords, sources, limit)
+        articles = await asyncio.to_thread(news_fetcher.fetch_news, keywords, sources, limit)
         
         if not articles:
             return jsonify({'error': 'No articles found'}), 404
         
         # Analyze sentiment
         logger.info(f"Analyzing sentiment for {len(articles)} articles")
-        analyzed_articles = []
+        sentiment_results = await asyncio.to_thread(
+            sentiment_analyzer.analyze_batch, [article['content'] for article in articles]
+        )
         
-        for article in articles:
-            sentiment_result = sentiment_analyzer.analyze(article['content'])
-            article.update(sentiment_result)
+        analyzed_articles = []
+        for article, sentiment_result in zip(articles, sentiment_results):
+            article.update(sentiment_result.to_dict())
             analyzed_articles.append(article)
         
+        sentiment_counts = Counter(a['sentiment'] for a in analyzed_articles)
+        
         # Store results
-        data_manager.store_analysis(keywords, analyzed_articles)
+        await asyncio.to_thread(data_manager.store_analysis, keywords, analyzed_articles, sentiment_counts)
         
-        return jsonify({
+        result = {
             'success': True,
             'articles': analyzed_articles,
             'summary': {
                 'total_articles': len(analyzed_articles),
-                'positive': len([a for a in analyzed_articles if a['sentiment'] == 'positive']),
-                'negative': len([a for a in analyzed_articles if a['sentiment'] == 'negative']),
-                'neutral': len([a for a in analyzed_articles if a['sentiment'] == 'neutral'])
+                'positive': sentiment_counts['positive'],
+                'negative': sentiment_counts['negative'],
+                'neutral': sentiment_counts['neutral']
             }
-        })
+        }
+        analyze_cache[cache_key] = result
+        
+        return jsonify(result)
         
     except Exception as e:
         logger.error(f"Error in analyze_news: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/history')
-def get_history():
+async def get_history():
     """Get analysis history"""
     try:
         days = request.args.get('days', 7, type=int)
-        history = data_manager.get_history(days)
+        history = await asyncio.to_thread(data_manager.get_history, days)
         return jsonify(history)
     except Exception as e:
         logger.error(f"Error in get_history: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/trends/<keyword>')
-def get_trends(keyword):
+async def get_trends(keyword):
     """Get sentiment trends for a specific keyword"""
     try:
         days = request.args.get('days', 7, type=int)
-        trends = data_manager.get_trends(keyword, days)
+        trends = await asyncio.to_thread(data_manager.get_trends, keyword, days)
         return jsonify(trends)
     except Exception as e:
         logger.error(f"Error in get_trends: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
+@app.route('/api/export')
+async def export_analysis():
+    """Stream stored analysis results as JSON or CSV"""
+    keywords = request.args.get('keywords')
+    days = request.args.get('days', 7, type=int)
+    export_format = request.args.get('format', 'json').lower()
+    columns = request.args.get('columns')
+    
+    try:
+        chunks = data_manager.export_data(
+            keywords, days, export_format, columns.split(',') if columns else None
+        )
+    except ValueError as e:
+        return jsonify({'error': str(e)}), 400
+    
+    async def generate():
+        # Pull each chunk on a worker thread so SQLite reads don't block the loop
+        while True:
+            chunk = await asyncio.to_thread(next, chunks, None)
+            if chunk is None:
+                break
+            yield chunk
+    
+    mimetype = 'text/csv' if export_format == 'csv' else 'application/json'
+    return Response(generate(), mimetype=mimetype)
+
 @app.route('/api/chart/sentiment/<keyword>')
-def sentiment_chart(keyword):
+@rate_limit(60, timedelta(minutes=1))
+async def sentiment_chart(keyword):
     """Generate sentiment distribution chart"""
     try:
         days = request.args.get('days', 7, type=int)
-        chart_data = create_sentiment_chart(keyword, days)
+        chart_data = await asyncio.to_thread(create_sentiment_chart, keyword, days)
         return jsonify(chart_data)
     except Exception as e:
         logger.error(f"Error in sentiment_chart: {str(e)}")
         return jsonify({'error': str(e)}), 500
 
 @app.route('/api/chart/trends/<keyword>')
-def trend_chart(keyword):
+@rate_limit(60, timedelta(minutes=1))
+async def trend_chart(keyword):
     """Generate sentiment trend chart"""
     try:
         days = request.args.get('days', 7, type=int)
-        chart_data = create_trend_chart(keyword, days)
+        chart_data = await asyncio.to_thread(create_trend_chart, keyword, days)
         return jsonify(chart_data)
     except Exception as e:
         logger.error(f"Error in trend_chart: {str(e)}")
@@ -30,15 +30,35 @@ class Config:
         'https://www.theguardian.com/uk/rss'
     ]
     
+    MAX_REQUESTS_PER_DOMAIN = 2  # Concurrent requests allowed per host
+    HTTP_POOL_CONNECTIONS = 20  # Hosts with a kept-alive connection pool
+    CONTENT_FETCH_WORKERS = 10  # Article pages fetched concurrently per request
+    FULL_TEXT_THRESHOLD = 500  # Characters of feed-supplied text needed to skip the page fetch
+    DUPLICATE_TITLE_THRESHOLD = 0.8  # MinHash similarity above which titles are duplicates
+    
     # Sentiment analysis settings
     SENTIMENT_MODEL = 'cardiffnlp/twitter-roberta-base-sentiment-latest'
     CONFIDENCE_THRESHOLD = 0.6
+    QUANTIZED_MODEL_PATH = os.environ.get('QUANTIZED_MODEL_PATH', '')  # int8 ONNX export of SENTIMENT_MODEL
+    MODEL_DTYPE = os.environ.get('MODEL_DTYPE', 'auto')  # auto, float32, float16 or bfloat16
+    COMPILE_MODELS = os.environ.get('COMPILE_MODELS', 'False').lower() == 'true'  # torch.compile on GPU
+    TOKEN_LENGTH_BUCKETS = [64, 128, 256, 512]  # Upper bounds for padding-aware batching
+    TEXTBLOB_WORKERS = int(os.environ.get('TEXTBLOB_WORKERS', 2))  # Worker processes per app process; 0 = in-process
     
     # Caching settings
     CACHE_TIMEOUT = 3600  # 1 hour in seconds
+    CHART_CACHE_TIMEOUT = 300  # Seconds a built chart is reused for the same arguments
+    TREND_MAX_POINTS = 200  # Longer trend series are downsampled (LTTB) to about this many points
+    HTTP_CACHE_PATH = os.path.join('data', 'http_cache')  # requests-cache SQLite file (.sqlite added)
+    CONTENT_CACHE_SIZE = 2048  # Extracted article bodies kept in memory
+    
+    # Response compression
+    COMPRESS_LEVEL = 4
+    COMPRESS_MIN_SIZE = 1024  # bytes
     
     # Rate limiting
     REQUESTS_PER_MINUTE = 100
+    RATE_LIMIT_STORAGE_URL = os.environ.get('RATE_LIMIT_STORAGE_URL', '')  # e.g. redis://localhost:6379
     
     @staticmethod
     def validate_config():
@@ -1,28 +1,237 @@
 import sqlite3
-import json
-import pandas as pd
+import orjson
+import msgpack
+import csv
+import io
+import numpy as np
 from datetime import datetime, timedelta
-from typing import List, Dict, Optional
+from typing import List, Dict, Iterator, Optional
 import logging
 from config import Config
 import os
+import threading
+from collections import Counter
+from contextlib import contextmanager
 
 logger = logging.getLogger(__name__)
 
+# Rows fetched per round-trip when streaming exports
+EXPORT_CHUNK_SIZE = 1000
+
+# Columns that may be requested in an export, and the narrow default projection
+EXPORT_COLUMNS = (
+    'id', 'keywords', 'title', 'content', 'description', 'url', 'source', 'author',
+    'published_at', 'sentiment', 'confidence', 'positive_score', 'negative_score',
+    'neutral_score', 'model_details', 'created_at'
+)
+DEFAULT_EXPORT_COLUMNS = (
+    'keywords', 'title', 'url', 'source', 'published_at', 'sentiment', 'confidence', 'created_at'
+)
+
+# SQL is kept in module constants so each statement string is built once and
+# hits sqlite3's per-connection prepared statement cache on every call
+# Keyword filters on both tables go through FTS5 with the same prefix rule (_fts_match)
+_KEYWORD_MATCH = "id IN (SELECT rowid FROM analysis_fts WHERE analysis_fts MATCH ?)"
+_SUMMARY_KEYWORD_MATCH = "id IN (SELECT rowid FROM analysis_summary_fts WHERE analysis_summary_fts MATCH ?)"
+
+_INSERT_SQL = '''
+    INSERT INTO analysis_results (
+        keywords, title, content, description, url, source, author,
+        published_at, sentiment, confidence, positive_score,
+        negative_score, neutral_score, model_details
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+'''
+
+# Summary days use date('now') so they line up with created_date (both UTC)
+_SUMMARY_UPSERT_SQL = '''
+    INSERT INTO analysis_summary (
+        keywords, date, total_articles, positive_count, negative_count,
+        neutral_count, avg_confidence
+    ) VALUES (?, date('now'), ?, ?, ?, ?, ?)
+    ON CONFLICT(keywords, date) DO UPDATE SET
+        total_articles = total_articles + excluded.total_articles,
+        positive_count = positive_count + excluded.positive_count,
+        negative_count = negative_count + excluded.negative_count,
+        neutral_count = neutral_count + excluded.neutral_count,
+        avg_confidence = (avg_confidence * total_articles + excluded.avg_confidence * excluded.total_articles)
+            / MAX(total_articles + excluded.total_articles, 1)
+'''
+
+_SUMMARY_REBUILD_SQL = '''
+    INSERT INTO analysis_summary (
+        keywords, date, total_articles, positive_count, negative_count,
+        neutral_count, avg_confidence
+    )
+    SELECT 
+        keywords,
+        created_date,
+        COUNT(*),
+        SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END),
+        SUM(CASE WHEN sentiment = 'neutral' THEN 1 ELSE 0 END),
+        AVG(confidence)
+    FROM analysis_results
+    GROUP BY keywords, created_date
+'''
+
+_DAILY_VOLUME_REBUILD_SQL = '''
+    INSERT INTO daily_volume (source, day, article_count)
+    SELECT IFNULL(source, ''), created_date, COUNT(*)
+    FROM analysis_results
+    GROUP BY IFNULL(source, ''), created_date
+'''
+
+# Bumped whenever a one-off data migration is added to _init_database
+_SCHEMA_VERSION = 5
+
+_HISTORY_SQL = '''
+    SELECT keywords, sentiment, confidence, created_at, title, source
+    FROM analysis_results 
+    WHERE created_date >= ?
+    ORDER BY created_at DESC
+    LIMIT 100
+'''
+
+_TRENDS_SQL = '''
+    SELECT 
+        date,
+        SUM(positive_count),
+        SUM(negative_count),
+        SUM(neutral_count),
+        SUM(total_articles)
+    FROM analysis_summary 
+    WHERE date >= ? AND {keyword_match}
+    GROUP BY date
+    ORDER BY date
+'''.format(keyword_match=_SUMMARY_KEYWORD_MATCH)
+
+_SUMMARY_STATS_SQL = '''
+    SELECT 
+        SUM(total_articles) as total_articles,
+        SUM(positive_count) as positive_count,
+        SUM(negative_count) as negative_count,
+        SUM(neutral_count) as neutral_count,
+        SUM(avg_confidence * total_articles) / SUM(total_articles) as avg_confidence,
+        COUNT(DISTINCT keywords) as unique_keywords
+    FROM analysis_summary
+    WHERE date >= ?
+'''
+_SUMMARY_STATS_KW_SQL = _SUMMARY_STATS_SQL + f" AND {_SUMMARY_KEYWORD_MATCH}"
+
+# Per-keyword summary totals for a JSON object of {keyword: FTS match expression},
+# in one statement
+_SUMMARY_STATS_BATCH_SQL = '''
+    SELECT 
+        requested.key as keyword,
+        SUM(s.total_articles) as total_articles,
+        SUM(s.positive_count) as positive_count,
+        SUM(s.negative_count) as negative_count,
+        SUM(s.neutral_count) as neutral_count,
+        SUM(s.avg_confidence * s.total_articles) / SUM(s.total_articles) as avg_confidence
+    FROM json_each(?) as requested
+    JOIN analysis_summary_fts f ON f.analysis_summary_fts MATCH requested.value
+    JOIN analysis_summary s ON s.id = f.rowid
+    WHERE s.date >= ?
+    GROUP BY requested.key
+'''
+
+# daily_volume already holds each day's sources ('' stands for a missing source);
+# keyword counts need the raw rows, reached through the FTS matches
+_UNIQUE_SOURCES_SQL = '''
+    SELECT COUNT(DISTINCT NULLIF(source, ''))
+    FROM daily_volume
+    WHERE day >= ?
+'''
+_UNIQUE_SOURCES_KW_SQL = '''
+    SELECT COUNT(DISTINCT NULLIF(source, ''))
+    FROM analysis_results
+    WHERE created_date >= ? AND {keyword_match}
+'''.format(keyword_match=_KEYWORD_MATCH)
+
+# Read from the trigger-maintained daily_volume table ('' stands for a missing source)
+_SOURCE_VOLUME_SQL = '''
+    SELECT 
+        NULLIF(source, '') as source,
+        day as date,
+        article_count
+    FROM daily_volume 
+    WHERE day >= ?
+    ORDER BY day, daily_volume.source
+'''
+
+# Confidence histogram in CONFIDENCE_BINS equal-width bins per sentiment; a
+# confidence of exactly 1.0 falls into the last bin. created_at text sorts after
+# its own date, so created_at >= 'YYYY-MM-DD' matches created_date >= 'YYYY-MM-DD'
+# while reading only idx_created_cover
+CONFIDENCE_BINS = 20
+
+_CONFIDENCE_HISTOGRAM_SQL = '''
+    SELECT 
+        MIN(CAST(confidence * {bins} AS INTEGER), {last_bin}) as bin,
+        sentiment,
+        COUNT(*) as article_count,
+        AVG(confidence) as avg_confidence
+    FROM analysis_results
+    WHERE created_at >= ?{{keyword_filter}}
+    GROUP BY bin, sentiment
+    ORDER BY bin, sentiment
+'''.format(bins=CONFIDENCE_BINS, last_bin=CONFIDENCE_BINS - 1)
+_CONFIDENCE_SQL = _CONFIDENCE_HISTOGRAM_SQL.format(keyword_filter='')
+_CONFIDENCE_KW_SQL = _CONFIDENCE_HISTOGRAM_SQL.format(keyword_filter=f" AND {_KEYWORD_MATCH}")
+
+_TOP_KEYWORDS_SQL = '''
+    SELECT 
+        keywords,
+        COUNT(*) as article_count,
+        AVG(confidence) as avg_confidence,
+        SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END) as positive_count,
+        SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END) as negative_count
+    FROM analysis_results 
+    WHERE created_date >= ?
+    GROUP BY keywords
+    ORDER BY article_count DESC
+    LIMIT ?
+'''
+
+# Export templates take a validated column list
+_EXPORT_SQL = "SELECT {columns} FROM analysis_results WHERE created_date >= ? ORDER BY created_at DESC"
+_EXPORT_KW_SQL = (
+    "SELECT {columns} FROM analysis_results WHERE created_date >= ? AND "
+    + _KEYWORD_MATCH + " ORDER BY created_at DESC"
+)
+
 class DataManager:
     """Manages data storage and retrieval for sentiment analysis"""
     
+    # Bumped whenever stored data changes so derived caches (charts) can be keyed on it
+    data_version = 0
+    
     def __init__(self):
         self.db_path = Config.DATABASE_PATH
+        self._lock = threading.RLock()
+        self._conn = None
         self._init_database()
     
+    @contextmanager
+    def _connection(self):
+        """Yield the shared connection, serialized across threads, inside a transaction"""
+        with self._lock:
+            with self._conn:
+                yield self._conn
+    
     def _init_database(self):
         """Initialize SQLite database with required tables"""
         try:
             # Ensure data directory exists
             os.makedirs(os.path.dirname(self.db_path), exist_ok=True)
             
-            with sqlite3.connect(self.db_path) as conn:
+            # One connection shared by every call; access is guarded by self._lock
+            self._conn = sqlite3.connect(self.db_path, check_same_thread=False)
+            self._conn.execute('PRAGMA journal_mode=WAL')
+            self._conn.execute('PRAGMA synchronous=NORMAL')
+            self._conn.execute('PRAGMA cache_size=-65536')  # 64 MB page cache
+            
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Create analysis table
@@ -43,10 +252,19 @@ class DataManager:
                         negative_score REAL NOT NULL,
                         neutral_score REAL NOT NULL,
                         model_details TEXT,
-                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                        created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+                        created_date TEXT GENERATED ALWAYS AS (date(created_at)) VIRTUAL
                     )
                 ''')
                 
+                # Databases created before created_date existed get it added in place
+                columns = [row[1] for row in cursor.execute('PRAGMA table_xinfo(analysis_results)')]
+                if 'created_date' not in columns:
+                    cursor.execute('''
+                        ALTER TABLE analysis_results
+                        ADD COLUMN created_date TEXT GENERATED ALWAYS AS (date(created_at)) VIRTUAL
+                    ''')
+                
                 # Create summary table for quick analytics
                 cursor.execute('''
                     CREATE TABLE IF NOT EXISTS analysis_summary (
@@ -63,11 +281,118 @@ class DataManager:
                     )
                 ''')
                 
+                # Articles per source and day, kept current by a trigger so the volume
+                # chart reads a few rows instead of grouping analysis_results
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS daily_volume (
+                        source TEXT NOT NULL,
+                        day TEXT NOT NULL,
+                        article_count INTEGER NOT NULL DEFAULT 0,
+                        PRIMARY KEY (day, source)
+                    ) WITHOUT ROWID
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS daily_volume_insert AFTER INSERT ON analysis_results BEGIN
+                        INSERT INTO daily_volume (source, day, article_count)
+                        VALUES (IFNULL(new.source, ''), date(new.created_at), 1)
+                        ON CONFLICT(day, source) DO UPDATE SET article_count = article_count + 1;
+                    END
+                ''')
+                
+                schema_version = cursor.execute('PRAGMA user_version').fetchone()[0]
+                
+                # Summaries written with INSERT OR REPLACE kept only the last batch of
+                # each day; rebuild them once from the raw rows
+                if schema_version < 1:
+                    cursor.execute('DELETE FROM analysis_summary')
+                    cursor.execute(_SUMMARY_REBUILD_SQL)
+                    logger.info("Rebuilt analysis summary from stored results")
+                
+                # Count rows stored before daily_volume existed
+                if schema_version < 2:
+                    cursor.execute('DELETE FROM daily_volume')
+                    cursor.execute(_DAILY_VOLUME_REBUILD_SQL)
+                    logger.info("Built daily volume from stored results")
+                
+                # Older rows stored model_details as JSON text; repack them as MessagePack
+                if schema_version < 3:
+                    legacy_rows = cursor.execute(
+                        "SELECT id, model_details FROM analysis_results WHERE typeof(model_details) = 'text'"
+                    ).fetchall()
+                    if legacy_rows:
+                        cursor.executemany(
+                            'UPDATE analysis_results SET model_details = ? WHERE id = ?',
+                            [(self._pack_details(self._load_legacy_details(details)), row_id)
+                             for row_id, details in legacy_rows]
+                        )
+                        logger.info(f"Converted model details of {len(legacy_rows)} rows to MessagePack")
+                
+                # idx_created_at is a prefix of idx_created_cover and only costs writes
+                if schema_version < 4:
+                    cursor.execute('DROP INDEX IF EXISTS idx_created_at')
+                
+                # Keyword filters go through analysis_fts, so these only cost writes
+                if schema_version < 5:
+                    cursor.execute('DROP INDEX IF EXISTS idx_keywords')
+                    cursor.execute('DROP INDEX IF EXISTS idx_kw_created')
+                cursor.execute(f'PRAGMA user_version = {_SCHEMA_VERSION}')
+                
                 # Create indexes for better performance
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_keywords ON analysis_results(keywords)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_sentiment ON analysis_results(sentiment)')
-                cursor.execute('CREATE INDEX IF NOT EXISTS idx_created_at ON analysis_results(created_at)')
                 cursor.execute('CREATE INDEX IF NOT EXISTS idx_published_at ON analysis_results(published_at)')
+                cursor.execute('CREATE INDEX IF NOT EXISTS idx_created_date ON analysis_results(created_date)')
+                # Covers the confidence chart query (SQLite cannot use an index on the
+                # virtual created_date column as a covering index) and created_at ordering
+                cursor.execute('''
+                    CREATE INDEX IF NOT EXISTS idx_created_cover
+                    ON analysis_results(created_at, source, sentiment, confidence)
+                ''')
+                
+                # Full-text index over keywords so keyword filters avoid a leading-wildcard LIKE scan
+                fts_exists = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'analysis_fts'"
+                ).fetchone()
+                cursor.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS analysis_fts USING fts5(
+                        keywords, content='analysis_results', content_rowid='id'
+                    )
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS analysis_fts_insert AFTER INSERT ON analysis_results BEGIN
+                        INSERT INTO analysis_fts(rowid, keywords) VALUES (new.id, new.keywords);
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS analysis_fts_delete AFTER DELETE ON analysis_results BEGIN
+                        INSERT INTO analysis_fts(analysis_fts, rowid, keywords) VALUES ('delete', old.id, old.keywords);
+                    END
+                ''')
+                if not fts_exists:
+                    # Index rows stored before the FTS table existed
+                    cursor.execute("INSERT INTO analysis_fts(analysis_fts) VALUES ('rebuild')")
+                
+                # Same index over the daily summaries, so trends and stats match keywords
+                # exactly as the per-article queries do
+                summary_fts_exists = cursor.execute(
+                    "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'analysis_summary_fts'"
+                ).fetchone()
+                cursor.execute('''
+                    CREATE VIRTUAL TABLE IF NOT EXISTS analysis_summary_fts USING fts5(
+                        keywords, content='analysis_summary', content_rowid='id'
+                    )
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS analysis_summary_fts_insert AFTER INSERT ON analysis_summary BEGIN
+                        INSERT INTO analysis_summary_fts(rowid, keywords) VALUES (new.id, new.keywords);
+                    END
+                ''')
+                cursor.execute('''
+                    CREATE TRIGGER IF NOT EXISTS analysis_summary_fts_delete AFTER DELETE ON analysis_summary BEGIN
+                        INSERT INTO analysis_summary_fts(analysis_summary_fts, rowid, keywords) VALUES ('delete', old.id, old.keywords);
+                    END
+                ''')
+                if not summary_fts_exists:
+                    cursor.execute("INSERT INTO analysis_summary_fts(analysis_summary_fts) VALUES ('rebuild')")
                 
                 conn.commit()
                 logger.info("Database initialized successfully")
@@ -76,21 +401,44 @@ class DataManager:
             logger.error(f"Database initialization error: {e}")
             raise
     
-    def store_analysis(self, keywords: str, articles: List[Dict]) -> bool:
+    @staticmethod
+    def _pack_details(details) -> bytes:
+        """Encode model details as a MessagePack BLOB"""
+        return msgpack.packb(details, use_bin_type=True)
+    
+    @staticmethod
+    def _unpack_details(details) -> str:
+        """Decode a stored model details BLOB to JSON text"""
+        if isinstance(details, bytes):
+            return orjson.dumps(msgpack.unpackb(details, raw=False)).decode()
+        return details
+    
+    @staticmethod
+    def _load_legacy_details(details: str):
+        """Parse model details stored as JSON text, keeping unparseable text as-is"""
+        try:
+            return orjson.loads(details)
+        except orjson.JSONDecodeError:
+            return details
+    
+    @staticmethod
+    def _fts_match(keyword: str) -> str:
+        """Build an FTS5 MATCH expression for a keyword phrase in the keywords column
+        
+        The last token is matched as a prefix, so 'tech' finds 'technology'.
+        """
+        return 'keywords : "{}"*'.format(keyword.replace('"', '""'))
+    
+    def store_analysis(self, keywords: str, articles: List[Dict],
+                       sentiment_counts: Optional[Dict[str, int]] = None) -> bool:
         """Store analysis results in database"""
         try:
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Store individual articles
-                for article in articles:
-                    cursor.execute('''
-                        INSERT INTO analysis_results (
-                            keywords, title, content, description, url, source, author,
-                            published_at, sentiment, confidence, positive_score,
-                            negative_score, neutral_score, model_details
-                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-                    ''', (
+                # Store individual articles in one prepared statement
+                rows = [
+                    (
                         keywords,
                         article.get('title', ''),
                         article.get('content', ''),
@@ -104,13 +452,17 @@ class DataManager:
                         article.get('scores', {}).get('positive', 0),
                         article.get('scores', {}).get('negative', 0),
                         article.get('scores', {}).get('neutral', 0),
-                        json.dumps(article.get('details', {}))
-                    ))
+                        self._pack_details(article.get('details', {}))
+                    )
+                    for article in articles
+                ]
+                cursor.executemany(_INSERT_SQL, rows)
                 
                 # Update summary
-                self._update_summary(cursor, keywords, articles)
+                self._update_summary(cursor, keywords, articles, sentiment_counts)
                 
                 conn.commit()
+                DataManager.data_version += 1
                 logger.info(f"Stored {len(articles)} articles for keywords: {keywords}")
                 return True
                 
@@ -118,42 +470,30 @@ class DataManager:
             logger.error(f"Error storing analysis: {e}")
             return False
     
-    def _update_summary(self, cursor, keywords: str, articles: List[Dict]):
+    def _update_summary(self, cursor, keywords: str, articles: List[Dict],
+                        sentiment_counts: Optional[Dict[str, int]] = None):
         """Update daily summary statistics"""
-        today = datetime.now().strftime('%Y-%m-%d')
-        
-        # Calculate statistics
+        # Calculate statistics in a single pass unless the caller already counted
+        if sentiment_counts is None:
+            sentiment_counts = Counter(a.get('sentiment', '') for a in articles)
         total_articles = len(articles)
-        positive_count = len([a for a in articles if a.get('sentiment') == 'positive'])
-        negative_count = len([a for a in articles if a.get('sentiment') == 'negative'])
-        neutral_count = len([a for a in articles if a.get('sentiment') == 'neutral'])
-        avg_confidence = sum([a.get('confidence', 0) for a in articles]) / len(articles) if articles else 0
+        positive_count = sentiment_counts.get('positive', 0)
+        negative_count = sentiment_counts.get('negative', 0)
+        neutral_count = sentiment_counts.get('neutral', 0)
+        avg_confidence = sum(a.get('confidence', 0) for a in articles) / len(articles) if articles else 0
         
-        # Insert or update summary
-        cursor.execute('''
-            INSERT OR REPLACE INTO analysis_summary (
-                keywords, date, total_articles, positive_count, negative_count,
-                neutral_count, avg_confidence
-            ) VALUES (?, ?, ?, ?, ?, ?, ?)
-        ''', (keywords, today, total_articles, positive_count, negative_count, neutral_count, avg_confidence))
+        # Insert or accumulate into today's summary row
+        cursor.execute(_SUMMARY_UPSERT_SQL, (keywords, total_articles, positive_count, negative_count, neutral_count, avg_confidence))
     
     def get_history(self, days: int = 7) -> List[Dict]:
         """Get analysis history for the last N days"""
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                query = '''
-                    SELECT keywords, sentiment, confidence, created_at, title, source
-                    FROM analysis_results 
-                    WHERE date(created_at) >= ?
-                    ORDER BY created_at DESC
-                    LIMIT 100
-                '''
-                
-                cursor.execute(query, (cutoff_date,))
+                cursor.execute(_HISTORY_SQL, (cutoff_date,))
                 results = cursor.fetchall()
                 
                 history = []
@@ -178,48 +518,37 @@ class DataManager:
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Get daily trends
-                query = '''
-                    SELECT 
-                        date(created_at) as date,
-                        sentiment,
-                        COUNT(*) as count,
-                        AVG(confidence) as avg_confidence
-                    FROM analysis_results 
-                    WHERE keywords LIKE ? AND date(created_at) >= ?
-                    GROUP BY date(created_at), sentiment
-                    ORDER BY date(created_at)
-                '''
-                
-                cursor.execute(query, (f'%{keyword}%', cutoff_date))
+                # Get daily trends from the pre-aggregated summary
+                cursor.execute(_TRENDS_SQL, (cutoff_date, self._fts_match(keyword)))
                 results = cursor.fetchall()
                 
-                # Organize data by date
-                trends = {}
-                for row in results:
-                    date, sentiment, count, avg_conf = row
-                    if date not in trends:
-                        trends[date] = {'positive': 0, 'negative': 0, 'neutral': 0, 'total': 0}
-                    
-                    trends[date][sentiment] = count
-                    trends[date]['total'] += count
+                # Compute all percentages at once; rows are already one per date in order
+                dates = [row[0] for row in results]
+                counts = np.array([row[1:] for row in results], dtype=np.int64).reshape(-1, 4)
+                totals = counts[:, 3:]
+                percentages = np.divide(
+                    counts[:, :3] * 100.0, totals,
+                    out=np.zeros((len(counts), 3)), where=totals > 0
+                )
                 
                 # Convert to list format
-                trend_list = []
-                for date, data in sorted(trends.items()):
-                    trend_list.append({
+                trend_list = [
+                    {
                         'date': date,
-                        'positive': data['positive'],
-                        'negative': data['negative'],
-                        'neutral': data['neutral'],
-                        'total': data['total'],
-                        'positive_pct': (data['positive'] / data['total'] * 100) if data['total'] > 0 else 0,
-                        'negative_pct': (data['negative'] / data['total'] * 100) if data['total'] > 0 else 0,
-                        'neutral_pct': (data['neutral'] / data['total'] * 100) if data['total'] > 0 else 0
-                    })
+                        'positive': positive,
+                        'negative': negative,
+                        'neutral': neutral,
+                        'total': total,
+                        'positive_pct': positive_pct,
+                        'negative_pct': negative_pct,
+                        'neutral_pct': neutral_pct
+                    }
+                    for date, (positive, negative, neutral, total), (positive_pct, negative_pct, neutral_pct)
+                    in zip(dates, counts.tolist(), percentages.tolist())
+                ]
                 
                 return {
                     'keyword': keyword,
@@ -236,33 +565,24 @@ class DataManager:
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                # Base query
-                where_clause = "WHERE date(created_at) >= ?"
-                params = [cutoff_date]
-                
+                # Counts and confidence come from the pre-aggregated summary
                 if keywords:
-                    where_clause += " AND keywords LIKE ?"
-                    params.append(f'%{keywords}%')
-                
-                query = f'''
-                    SELECT 
-                        COUNT(*) as total_articles,
-                        SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END) as positive_count,
-                        SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END) as negative_count,
-                        SUM(CASE WHEN sentiment = 'neutral' THEN 1 ELSE 0 END) as neutral_count,
-                        AVG(confidence) as avg_confidence,
-                        COUNT(DISTINCT keywords) as unique_keywords,
-                        COUNT(DISTINCT source) as unique_sources
-                    FROM analysis_results {where_clause}
-                '''
-                
-                cursor.execute(query, params)
+                    cursor.execute(_SUMMARY_STATS_KW_SQL, (cutoff_date, self._fts_match(keywords)))
+                else:
+                    cursor.execute(_SUMMARY_STATS_SQL, (cutoff_date,))
                 result = cursor.fetchone()
                 
-                if result and result[0] > 0:
+                # Sources are not tracked in the summary, so count them separately
+                if keywords:
+                    cursor.execute(_UNIQUE_SOURCES_KW_SQL, (cutoff_date, self._fts_match(keywords)))
+                else:
+                    cursor.execute(_UNIQUE_SOURCES_SQL, (cutoff_date,))
+                result = tuple(result) + cursor.fetchone()
+                
+                if result and result[0]:
                     total = result[0]
                     return {
                         'total_articles': total,
@@ -296,29 +616,49 @@ class DataManager:
             logger.error(f"Error getting summary stats: {e}")
             return {}
     
+    def get_summary_stats_batch(self, keywords_list: List[str], days: int = 7) -> Dict[str, Dict]:
+        """Get sentiment counts and percentages for several keywords in one query"""
+        try:
+            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            # A repeated keyword would join its summary rows twice; keep first occurrences
+            unique_keywords = list(dict.fromkeys(keywords_list))
+            
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                matches = {keyword: self._fts_match(keyword) for keyword in unique_keywords}
+                cursor.execute(_SUMMARY_STATS_BATCH_SQL, (orjson.dumps(matches).decode(), cutoff_date))
+                
+                stats = {}
+                for keyword, total, positive, negative, neutral, avg_conf in cursor.fetchall():
+                    if not total:
+                        continue
+                    stats[keyword] = {
+                        'total_articles': total,
+                        'positive_count': positive,
+                        'negative_count': negative,
+                        'neutral_count': neutral,
+                        'positive_percentage': positive / total * 100,
+                        'negative_percentage': negative / total * 100,
+                        'neutral_percentage': neutral / total * 100,
+                        'avg_confidence': round(avg_conf or 0, 3),
+                        'period_days': days
+                    }
+                
+                return stats
+                
+        except Exception as e:
+            logger.error(f"Error getting batch summary stats: {e}")
+            return {}
+    
     def get_top_keywords(self, days: int = 7, limit: int = 10) -> List[Dict]:
         """Get most analyzed keywords"""
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
-                query = '''
-                    SELECT 
-                        keywords,
-                        COUNT(*) as article_count,
-                        AVG(confidence) as avg_confidence,
-                        SUM(CASE WHEN sentiment = 'positive' THEN 1 ELSE 0 END) as positive_count,
-                        SUM(CASE WHEN sentiment = 'negative' THEN 1 ELSE 0 END) as negative_count
-                    FROM analysis_results 
-                    WHERE date(created_at) >= ?
-                    GROUP BY keywords
-                    ORDER BY article_count DESC
-                    LIMIT ?
-                '''
-                
-                cursor.execute(query, (cutoff_date, limit))
+                cursor.execute(_TOP_KEYWORDS_SQL, (cutoff_date, limit))
                 results = cursor.fetchall()
                 
                 top_keywords = []
@@ -339,51 +679,132 @@ class DataManager:
             logger.error(f"Error getting top keywords: {e}")
             return []
     
-    def export_data(self, keywords: str = None, days: int = 7, format: str = 'json') -> Optional[str]:
-        """Export analysis data to JSON or CSV"""
+    def get_source_volume(self, days: int = 7) -> List[Dict]:
+        """Get daily article counts per source"""
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
-            with sqlite3.connect(self.db_path) as conn:
-                where_clause = "WHERE date(created_at) >= ?"
-                params = [cutoff_date]
-                
-                if keywords:
-                    where_clause += " AND keywords LIKE ?"
-                    params.append(f'%{keywords}%')
-                
-                query = f'''
-                    SELECT * FROM analysis_results {where_clause}
-                    ORDER BY created_at DESC
-                '''
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                cursor.execute(_SOURCE_VOLUME_SQL, (cutoff_date,))
                 
-                df = pd.read_sql_query(query, conn, params=params)
+                return [
+                    {'source': source, 'date': date, 'article_count': count}
+                    for source, date, count in cursor.fetchall()
+                ]
                 
-                if format.lower() == 'csv':
-                    return df.to_csv(index=False)
+        except Exception as e:
+            logger.error(f"Error getting source volume: {e}")
+            return []
+    
+    def get_confidence_histogram(self, keywords: str = None, days: int = 7) -> List[Dict]:
+        """Get article counts per confidence bin and sentiment for the period"""
+        try:
+            cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+            
+            with self._connection() as conn:
+                cursor = conn.cursor()
+                if keywords:
+                    cursor.execute(_CONFIDENCE_KW_SQL, (cutoff_date, self._fts_match(keywords)))
                 else:
-                    return df.to_json(orient='records', indent=2)
+                    cursor.execute(_CONFIDENCE_SQL, (cutoff_date,))
+                
+                return [
+                    {
+                        'bin': bin_index,
+                        'sentiment': sentiment,
+                        'article_count': article_count,
+                        'avg_confidence': avg_confidence
+                    }
+                    for bin_index, sentiment, article_count, avg_confidence in cursor.fetchall()
+                ]
+                
+        except Exception as e:
+            logger.error(f"Error getting confidence histogram: {e}")
+            return []
+    
+    def export_data(self, keywords: str = None, days: int = 7, format: str = 'json',
+                    columns: Optional[List[str]] = None) -> Iterator[str]:
+        """Stream analysis data as JSON or CSV text chunks"""
+        columns = list(columns or DEFAULT_EXPORT_COLUMNS)
+        invalid = [column for column in columns if column not in EXPORT_COLUMNS]
+        if invalid:
+            raise ValueError(f"Unknown export columns: {', '.join(invalid)}")
+        
+        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        
+        if keywords:
+            query, params = _EXPORT_KW_SQL, (cutoff_date, self._fts_match(keywords))
+        else:
+            query, params = _EXPORT_SQL, (cutoff_date,)
+        query = query.format(columns=', '.join(columns))
+        
+        return self._stream_export(query, params, columns, format)
+    
+    def _stream_export(self, query: str, params: tuple, columns: List[str], format: str) -> Iterator[str]:
+        """Yield export chunks for a prepared query"""
+        # A dedicated reader so a long export does not hold the shared connection;
+        # the stream may be resumed from different worker threads
+        conn = sqlite3.connect(self.db_path, check_same_thread=False)
+        try:
+            cursor = conn.execute(query, params)
+            details_index = columns.index('model_details') if 'model_details' in columns else None
+            
+            def fetch_chunks():
+                for rows in iter(lambda: cursor.fetchmany(EXPORT_CHUNK_SIZE), []):
+                    if details_index is None:
+                        yield rows
+                        continue
+                    
+                    # Model details are stored as MessagePack; export them as JSON text
+                    yield [
+                        row[:details_index] + (self._unpack_details(row[details_index]),) + row[details_index + 1:]
+                        for row in rows
+                    ]
+            
+            if format.lower() == 'csv':
+                buffer = io.StringIO()
+                writer = csv.writer(buffer)
+                writer.writerow(columns)
+                yield buffer.getvalue()
+                
+                for rows in fetch_chunks():
+                    buffer.seek(0)
+                    buffer.truncate(0)
+                    writer.writerows(rows)
+                    yield buffer.getvalue()
+            else:
+                yield '['
+                separator = ''
+                for rows in fetch_chunks():
+                    yield separator + ','.join(orjson.dumps(dict(zip(columns, row))).decode() for row in rows)
+                    separator = ','
+                yield ']'
                 
         except Exception as e:
             logger.error(f"Error exporting data: {e}")
-            return None
+        finally:
+            conn.close()
     
     def cleanup_old_data(self, days: int = 30):
         """Clean up old data to manage database size"""
         try:
             cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
             
-            with sqlite3.connect(self.db_path) as conn:
+            with self._connection() as conn:
                 cursor = conn.cursor()
                 
                 # Delete old records
-                cursor.execute('DELETE FROM analysis_results WHERE date(created_at) < ?', (cutoff_date,))
+                cursor.execute('DELETE FROM analysis_results WHERE created_date < ?', (cutoff_date,))
                 cursor.execute('DELETE FROM analysis_summary WHERE date < ?', (cutoff_date,))
+                cursor.execute('DELETE FROM daily_volume WHERE day < ?', (cutoff_date,))
+                
+                # VACUUM cannot run inside the open transaction
+                conn.commit()
+                DataManager.data_version += 1
                 
                 # Vacuum database to reclaim space
                 cursor.execute('VACUUM')
-                
-                conn.commit()
                 logger.info(f"Cleaned up data older than {days} days")
                 
         except Exception as e:
@@ -1,16 +1,165 @@
 import requests
-import feedparser
+import soupsieve
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from newsapi import NewsApiClient
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from cachetools import TTLCache
 from datetime import datetime, timedelta
+from dateutil import parser as dateutil_parser
 import logging
-import time
 import re
-from typing import List, Dict, Optional
+import string
+import threading
+import xml.etree.ElementTree as ET
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Callable, List, Dict, Optional, Tuple
+from urllib.parse import urlparse
 from config import Config
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+try:
+    import requests_cache
+except ImportError:
+    requests_cache = None
+
+try:
+    from datasketch import MinHash, MinHashLSH
+except ImportError:
+    MinHashLSH = None
+
+try:
+    import lxml  # noqa: F401
+    HTML_PARSER = 'lxml'
+except ImportError:
+    HTML_PARSER = 'html.parser'
+
 logger = logging.getLogger(__name__)
 
+CONTENT_CLASS_RE = re.compile(r'(article|post|entry)-content')
+WHITESPACE_RE = re.compile(r'\s+')
+# Bracketed text and boilerplate calls to action stripped from article bodies
+UNWANTED_PHRASES_RE = re.compile(
+    r'\[.*?\]|Click here|Read more|Subscribe|Advertisement', re.IGNORECASE
+)
+
+# Alternatives in a keyword query ("tesla OR spacex, musk"); phrases stay intact
+KEYWORD_SPLIT_RE = re.compile(r'\s+OR\s+|,')
+
+# NewsAPI's publishedAt format, parsed from integer slices without strptime
+ISO_UTC_RE = re.compile(r'^\d{4}-\d{2}-\d{2}T\d{2}:\d{2}:\d{2}Z$')
+
+# US zone abbreviations common in RSS pubDate values, as UTC offsets in seconds
+US_TZINFOS = {
+    'EST': -5 * 3600, 'EDT': -4 * 3600,
+    'CST': -6 * 3600, 'CDT': -5 * 3600,
+    'MST': -7 * 3600, 'MDT': -6 * 3600,
+    'PST': -8 * 3600, 'PDT': -7 * 3600
+}
+
+# Punctuation (ASCII plus typographic quotes and dashes) dropped when comparing titles
+TITLE_PUNCTUATION_TABLE = str.maketrans('', '', string.punctuation + '\u2018\u2019\u201c\u201d\u2013\u2014\u2026')
+
+# Permutations per title MinHash for near-duplicate detection
+MINHASH_PERMUTATIONS = 64
+
+# Upper bound on <item>/<entry> elements scanned per feed
+MAX_FEED_ITEMS = 200
+
+
+# Page chrome is kept whole so _parse_content can decompose it together with the
+# paragraphs inside it; otherwise those <p> tags would be kept on their own
+BOILERPLATE_TAGS = ('nav', 'header', 'footer', 'aside')
+
+def _is_content_tag(name: str, attrs: Optional[Dict] = None) -> bool:
+    """Match the tags _parse_content can read text from, plus the chrome it strips"""
+    # beautifulsoup4 >= 4.13 passes only the tag name to strainer functions
+    attrs = attrs or {}
+    if name in ('article', 'main', 'p') or name in BOILERPLATE_TAGS or attrs.get('role') == 'main':
+        return True
+    classes = attrs.get('class') or ''
+    if not isinstance(classes, str):
+        classes = ' '.join(classes)
+    return bool(CONTENT_CLASS_RE.search(classes))
+
+
+# Only content candidates (and everything inside them) are built into the tree
+CONTENT_STRAINER = SoupStrainer(_is_content_tag)
+
+# Article content selectors in priority order, compiled once
+CONTENT_SELECTORS = [
+    soupsieve.compile(selector) for selector in (
+        'article', '.article-content', '.post-content',
+        '.entry-content', '[role="main"]', 'main'
+    )
+]
+
+@dataclass(slots=True)
+class Article:
+    """A fetched news article"""
+    title: str
+    content: str
+    description: str
+    url: str
+    source: str
+    published_at: str
+    author: str = 'Unknown'
+    
+    def to_dict(self) -> Dict:
+        """Plain dict form for JSON responses and sentiment results"""
+        return {
+            'title': self.title,
+            'content': self.content,
+            'description': self.description,
+            'url': self.url,
+            'source': self.source,
+            'published_at': self.published_at,
+            'author': self.author
+        }
+
+def _keyword_matcher(keywords: str) -> Callable[[str], bool]:
+    """Build a predicate telling whether lowercased text mentions any keyword alternative"""
+    terms = list(dict.fromkeys(
+        term.strip().lower() for term in KEYWORD_SPLIT_RE.split(keywords) if term.strip()
+    )) or [keywords.lower()]
+    
+    if len(terms) == 1:
+        term = terms[0]
+        return lambda text: term in text
+    
+    if ahocorasick is None:
+        return lambda text: any(term in text for term in terms)
+    
+    # One pass over the text regardless of how many alternatives there are
+    automaton = ahocorasick.Automaton()
+    for term in terms:
+        automaton.add_word(term, term)
+    automaton.make_automaton()
+    return lambda text: next(automaton.iter(text), None) is not None
+
+@lru_cache(maxsize=256)
+def _parse_date_string(date_str: str) -> Optional[str]:
+    """Parse a feed/API date string to ISO format, or None if it can't be parsed"""
+    if ISO_UTC_RE.match(date_str):
+        # Kept naive, as NewsAPI timestamps have always been stored
+        return datetime(
+            int(date_str[0:4]), int(date_str[5:7]), int(date_str[8:10]),
+            int(date_str[11:13]), int(date_str[14:16]), int(date_str[17:19])
+        ).isoformat()
+    
+    try:
+        return dateutil_parser.parse(date_str, tzinfos=US_TZINFOS).isoformat()
+    except (ValueError, OverflowError):
+        return None
+
 class NewsFetcher:
     """Fetches news articles from multiple sources"""
     
@@ -19,10 +168,56 @@ class NewsFetcher:
         if Config.NEWSAPI_KEY:
             self.newsapi_client = NewsApiClient(api_key=Config.NEWSAPI_KEY)
         
-        self.session = requests.Session()
+        if requests_cache is not None:
+            # Disk-backed HTTP cache that revalidates with ETag/Last-Modified once stale
+            self.session = requests_cache.CachedSession(
+                Config.HTTP_CACHE_PATH,
+                backend='sqlite',
+                expire_after=Config.CACHE_TIMEOUT,
+                cache_control=True,
+                stale_if_error=True
+            )
+        else:
+            self.session = requests.Session()
+        # requests already advertises the encodings urllib3 can decode (br with brotli)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        
+        # Keep connections alive per host and retry transient upstream failures
+        adapter = HTTPAdapter(
+            pool_connections=Config.HTTP_POOL_CONNECTIONS,
+            pool_maxsize=Config.MAX_REQUESTS_PER_DOMAIN,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
+        
+        # Caps concurrent requests per host now that fetching runs in parallel
+        self._domain_slots = defaultdict(lambda: threading.Semaphore(Config.MAX_REQUESTS_PER_DOMAIN))
+        self._domain_slots_lock = threading.Lock()
+        
+        # Extracted article text by URL
+        self._content_cache = TTLCache(maxsize=Config.CONTENT_CACHE_SIZE, ttl=Config.CACHE_TIMEOUT)
+        self._content_cache_lock = threading.Lock()
+    
+    def close(self):
+        """Close pooled HTTP connections"""
+        self.session.close()
+    
+    def __enter__(self):
+        return self
+    
+    def __exit__(self, *exc_info):
+        self.close()
+    
+    @contextmanager
+    def _domain_slot(self, url: str):
+        """Hold one of the per-domain request slots for the duration of a request"""
+        with self._domain_slots_lock:
+            slot = self._domain_slots[urlparse(url).netloc]
+        with slot:
+            yield
     
     def fetch_news(self, keywords: str, sources: List[str] = None, limit: int = 10) -> List[Dict]:
         """
@@ -42,30 +237,37 @@ class NewsFetcher:
         all_articles = []
         articles_per_source = max(1, limit // len(sources))
         
-        for source in sources:
-            try:
-                if source == 'newsapi' and self.newsapi_client:
-                    articles = self._fetch_from_newsapi(keywords, articles_per_source)
-                elif source == 'rss':
-                    articles = self._fetch_from_rss(keywords, articles_per_source)
-                elif source == 'web':
-                    articles = self._fetch_from_web(keywords, articles_per_source)
-                else:
-                    logger.warning(f"Unknown source: {source}")
-                    continue
-                
-                all_articles.extend(articles)
-                time.sleep(0.5)  # Rate limiting
-                
-            except Exception as e:
-                logger.error(f"Error fetching from {source}: {str(e)}")
-                continue
+        # Sources are independent network round-trips, so fetch them concurrently
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = [
+                executor.submit(self._fetch_from_source, source, keywords, articles_per_source)
+                for source in sources
+            ]
+            
+            # Collect in request order so duplicate removal stays deterministic
+            for source, future in zip(sources, futures):
+                try:
+                    all_articles.extend(future.result())
+                except Exception as e:
+                    logger.error(f"Error fetching from {source}: {str(e)}")
         
         # Remove duplicates and limit results
         unique_articles = self._remove_duplicates(all_articles)
-        return unique_articles[:limit]
+        return [article.to_dict() for article in unique_articles[:limit]]
+    
+    def _fetch_from_source(self, source: str, keywords: str, limit: int) -> List[Article]:
+        """Fetch articles from a single source type"""
+        if source == 'newsapi' and self.newsapi_client:
+            return self._fetch_from_newsapi(keywords, limit)
+        elif source == 'rss':
+            return self._fetch_from_rss(keywords, limit)
+        elif source == 'web':
+            return self._fetch_from_web(keywords, limit)
+        
+        logger.warning(f"Unknown source: {source}")
+        return []
     
-    def _fetch_from_newsapi(self, keywords: str, limit: int) -> List[Dict]:
+    def _fetch_from_newsapi(self, keywords: str, limit: int) -> List[Article]:
         """Fetch articles from NewsAPI"""
         try:
             # Search for articles
@@ -80,15 +282,15 @@ class NewsFetcher:
             articles = []
             for article in response.get('articles', []):
                 if article.get('content') and len(article['content']) > 100:
-                    processed_article = {
-                        'title': article.get('title', ''),
-                        'content': self._clean_content(article.get('content', '')),
-                        'description': article.get('description', ''),
-                        'url': article.get('url', ''),
-                        'source': article.get('source', {}).get('name', 'NewsAPI'),
-                        'published_at': self._parse_date(article.get('publishedAt')),
-                        'author': article.get('author', 'Unknown')
-                    }
+                    processed_article = Article(
+                        title=article.get('title', ''),
+                        content=self._clean_content(article.get('content', '')),
+                        description=article.get('description', ''),
+                        url=article.get('url', ''),
+                        source=article.get('source', {}).get('name', 'NewsAPI'),
+                        published_at=self._parse_date(article.get('publishedAt')),
+                        author=article.get('author', 'Unknown')
+                    )
                     articles.append(processed_article)
             
             logger.info(f"Fetched {len(articles)} articles from NewsAPI")
@@ -98,48 +300,124 @@ class NewsFetcher:
             logger.error(f"NewsAPI error: {str(e)}")
             return []
     
-    def _fetch_from_rss(self, keywords: str, limit: int) -> List[Dict]:
+    def _fetch_from_rss(self, keywords: str, limit: int) -> List[Article]:
         """Fetch articles from RSS feeds"""
         articles = []
-        keywords_lower = keywords.lower()
+        matches_keywords = _keyword_matcher(keywords)
+        
+        # Stream all feeds concurrently, keeping only keyword matches
+        with ThreadPoolExecutor(max_workers=min(16, len(Config.RSS_FEEDS))) as executor:
+            feeds = list(executor.map(
+                lambda url: self._scan_feed(url, matches_keywords, limit), Config.RSS_FEEDS
+            ))
+        
+        # Collect keyword matches first so article pages can be fetched together
+        candidates = [(feed_title, entry) for feed_title, entries in feeds for entry in entries]
         
-        for feed_url in Config.RSS_FEEDS:
-            try:
-                feed = feedparser.parse(feed_url)
+        # Fetch only as many pages as are still needed, one concurrent batch at a time
+        position = 0
+        while len(articles) < limit and position < len(candidates):
+            batch = candidates[position:position + limit - len(articles)]
+            position += len(batch)
+            
+            # Entries whose feed already carries the full text skip the page fetch
+            contents = [self._feed_body_text(entry) for _, entry in batch]
+            missing = [i for i, content in enumerate(contents) if content is None]
+            fetched = self._extract_contents([batch[i][1].get('link', '') for i in missing])
+            for i, content in zip(missing, fetched):
+                contents[i] = content
+            
+            for (feed_title, entry), content in zip(batch, contents):
+                if content and len(content) > 100:
+                    article = Article(
+                        title=entry.get('title', ''),
+                        content=content,
+                        description=entry.get('summary', ''),
+                        url=entry.get('link', ''),
+                        source=feed_title,
+                        published_at=self._parse_date(entry.get('published')),
+                        author=entry.get('author', 'Unknown')
+                    )
+                    articles.append(article)
+        
+        logger.info(f"Fetched {len(articles)} articles from RSS feeds")
+        return articles
+    
+    def _feed_body_text(self, entry: Dict) -> Optional[str]:
+        """Article text embedded in a feed entry, or None if it is too short to use"""
+        body = entry.get('content') or entry.get('summary')
+        if not body:
+            return None
+        
+        text = self._clean_content(BeautifulSoup(body, HTML_PARSER).get_text(' ', strip=True))
+        return text if len(text) >= Config.FULL_TEXT_THRESHOLD else None
+    
+    def _scan_feed(self, feed_url: str, matches_keywords: Callable[[str], bool],
+                   limit: int) -> Tuple[str, List[Dict]]:
+        """Stream an RSS/Atom feed and return its title and up to limit keyword matches"""
+        feed_title = 'RSS Feed'
+        matches = []
+        try:
+            with self._domain_slot(feed_url), self.session.get(feed_url, stream=True, timeout=10) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
                 
-                for entry in feed.entries:
-                    # Check if keywords match title or summary
-                    title = entry.get('title', '').lower()
-                    summary = entry.get('summary', '').lower()
+                scanned = 0
+                in_entry = False
+                for event, elem in ET.iterparse(response.raw, events=('start', 'end')):
+                    tag = elem.tag.rsplit('}', 1)[-1]
+                    if tag not in ('item', 'entry'):
+                        # The first title outside an entry is the channel/feed title
+                        if (event == 'end' and tag == 'title' and not in_entry
+                                and feed_title == 'RSS Feed' and elem.text):
+                            feed_title = elem.text.strip()
+                        continue
                     
-                    if keywords_lower in title or keywords_lower in summary:
-                        content = self._extract_full_content(entry.get('link', ''))
-                        if content and len(content) > 100:
-                            article = {
-                                'title': entry.get('title', ''),
-                                'content': content,
-                                'description': entry.get('summary', ''),
-                                'url': entry.get('link', ''),
-                                'source': feed.feed.get('title', 'RSS Feed'),
-                                'published_at': self._parse_date(entry.get('published')),
-                                'author': entry.get('author', 'Unknown')
-                            }
-                            articles.append(article)
-                            
-                            if len(articles) >= limit:
-                                break
-                
-                if len(articles) >= limit:
-                    break
+                    if event == 'start':
+                        in_entry = True
+                        continue
                     
-            except Exception as e:
-                logger.error(f"RSS feed error for {feed_url}: {str(e)}")
-                continue
+                    in_entry = False
+                    entry = self._read_feed_entry(elem)
+                    elem.clear()
+                    
+                    if matches_keywords(entry['title'].lower()) or matches_keywords(entry['summary'].lower()):
+                        matches.append(entry)
+                    
+                    scanned += 1
+                    if len(matches) >= limit or scanned >= MAX_FEED_ITEMS:
+                        break
+        except Exception as e:
+            logger.error(f"RSS feed error for {feed_url}: {str(e)}")
         
-        logger.info(f"Fetched {len(articles)} articles from RSS feeds")
-        return articles
+        return feed_title, matches
     
-    def _fetch_from_web(self, keywords: str, limit: int) -> List[Dict]:
+    @staticmethod
+    def _read_feed_entry(elem) -> Dict[str, str]:
+        """Pull title, link, summary, date and author out of an <item>/<entry> element"""
+        fields = {}
+        for child in elem.iter():
+            tag = child.tag.rsplit('}', 1)[-1]
+            if tag == 'link' and child.get('href'):
+                # Atom links carry the URL in href; prefer the alternate link
+                if child.get('rel', 'alternate') == 'alternate':
+                    fields.setdefault('link', child.get('href'))
+            elif tag == 'name' and 'author' not in fields:
+                fields['author'] = (child.text or '').strip()
+            elif child.text and child.text.strip() and tag not in fields:
+                fields[tag] = child.text.strip()
+        
+        return {
+            'title': fields.get('title', ''),
+            'link': fields.get('link', ''),
+            'summary': fields.get('description') or fields.get('summary') or fields.get('content', ''),
+            # Full body HTML from RSS content:encoded or Atom content, when the feed ships it
+            'content': fields.get('encoded') or fields.get('content', ''),
+            'published': fields.get('pubDate') or fields.get('published') or fields.get('updated'),
+            'author': fields.get('author') or fields.get('creator', 'Unknown'),
+        }
+    
+    def _fetch_from_web(self, keywords: str, limit: int) -> List[Article]:
         """Fetch articles from web search (basic implementation)"""
         # This is a basic implementation - in production, you might use Google News API
         # or other news aggregation services
@@ -148,20 +426,21 @@ class NewsFetcher:
         # Example implementation using a simple news website
         try:
             search_url = f"https://news.google.com/rss/search?q={keywords}&hl=en&gl=US&ceid=US:en"
-            feed = feedparser.parse(search_url)
+            # The search results are already keyword matches, so every entry is kept
+            _, entries = self._scan_feed(search_url, lambda text: True, limit)
+            
+            contents = self._extract_contents([entry.get('link', '') for entry in entries])
             
-            for entry in feed.entries[:limit]:
-                content = self._extract_full_content(entry.get('link', ''))
+            for entry, content in zip(entries, contents):
                 if content:
-                    article = {
-                        'title': entry.get('title', ''),
-                        'content': content,
-                        'description': entry.get('summary', ''),
-                        'url': entry.get('link', ''),
-                        'source': 'Google News',
-                        'published_at': self._parse_date(entry.get('published')),
-                        'author': 'Unknown'
-                    }
+                    article = Article(
+                        title=entry.get('title', ''),
+                        content=content,
+                        description=entry.get('summary', ''),
+                        url=entry.get('link', ''),
+                        source='Google News',
+                        published_at=self._parse_date(entry.get('published'))
+                    )
                     articles.append(article)
                     
         except Exception as e:
@@ -170,61 +449,73 @@ class NewsFetcher:
         logger.info(f"Fetched {len(articles)} articles from web search")
         return articles
     
+    def _extract_contents(self, urls: List[str]) -> List[Optional[str]]:
+        """Extract article content for several URLs concurrently"""
+        if not urls:
+            return []
+        
+        with self._content_cache_lock:
+            contents = {url: self._content_cache[url] for url in urls if url in self._content_cache}
+        missing = list(dict.fromkeys(url for url in urls if url not in contents))
+        
+        if missing:
+            # Pages go through the shared session, so they get the HTTP cache, retries,
+            # pooled connections and per-domain limits like every other request
+            with ThreadPoolExecutor(max_workers=min(Config.CONTENT_FETCH_WORKERS, len(missing))) as executor:
+                fetched = list(executor.map(self._extract_full_content, missing))
+            
+            with self._content_cache_lock:
+                for url, content in zip(missing, fetched):
+                    contents[url] = content
+                    if content:
+                        self._content_cache[url] = content
+        
+        return [contents[url] for url in urls]
+    
     def _extract_full_content(self, url: str) -> Optional[str]:
         """Extract full article content from URL"""
         try:
-            response = self.session.get(url, timeout=10)
+            with self._domain_slot(url):
+                response = self.session.get(url, timeout=10)
             response.raise_for_status()
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
-            # Remove unwanted elements
-            for element in soup(['script', 'style', 'nav', 'header', 'footer', 'aside']):
-                element.decompose()
-            
-            # Try to find article content
-            content_selectors = [
-                'article', '.article-content', '.post-content', 
-                '.entry-content', '[role="main"]', 'main'
-            ]
-            
-            content = ""
-            for selector in content_selectors:
-                elements = soup.select(selector)
-                if elements:
-                    content = ' '.join([elem.get_text() for elem in elements])
-                    break
-            
-            if not content:
-                # Fallback to all paragraph text
-                paragraphs = soup.find_all('p')
-                content = ' '.join([p.get_text() for p in paragraphs])
-            
-            return self._clean_content(content)
+            return self._parse_content(response.content)
             
         except Exception as e:
             logger.error(f"Content extraction error for {url}: {str(e)}")
             return None
     
+    def _parse_content(self, html: bytes) -> str:
+        """Pull the main article text out of an HTML page"""
+        soup = BeautifulSoup(html, HTML_PARSER, parse_only=CONTENT_STRAINER)
+        
+        # Remove unwanted elements nested inside the kept content
+        for element in soup(['script', 'style', *BOILERPLATE_TAGS]):
+            element.decompose()
+        
+        # Try to find article content
+        content = ""
+        for selector in CONTENT_SELECTORS:
+            elements = selector.select(soup)
+            if elements:
+                content = ' '.join(elem.get_text(' ', strip=True) for elem in elements)
+                break
+        
+        if not content:
+            # Fallback to all paragraph text
+            paragraphs = soup.find_all('p')
+            content = ' '.join(p.get_text(' ', strip=True) for p in paragraphs)
+        
+        return self._clean_content(content)
+    
     def _clean_content(self, content: str) -> str:
         """Clean and normalize article content"""
         if not content:
             return ""
         
-        # Remove extra whitespace and newlines
-        content = re.sub(r'\s+', ' ', content)
-        
-        # Remove common unwanted phrases
-        unwanted_phrases = [
-            r'\[.*?\]',  # Remove text in brackets
-            r'Click here.*?',
-            r'Read more.*?',
-            r'Subscribe.*?',
-            r'Advertisement.*?'
-        ]
-        
-        for phrase in unwanted_phrases:
-            content = re.sub(phrase, '', content, flags=re.IGNORECASE)
+        # Remove extra whitespace and newlines, then common unwanted phrases
+        content = WHITESPACE_RE.sub(' ', content)
+        content = UNWANTED_PHRASES_RE.sub('', content)
         
         return content.strip()
     
@@ -233,42 +524,39 @@ class NewsFetcher:
         if not date_str:
             return datetime.now().isoformat()
         
-        try:
-            # Try different date formats
-            formats = [
-                '%Y-%m-%dT%H:%M:%SZ',
-                '%Y-%m-%dT%H:%M:%S%z',
-                '%a, %d %b %Y %H:%M:%S %Z',
-                '%a, %d %b %Y %H:%M:%S %z'
-            ]
-            
-            for fmt in formats:
-                try:
-                    dt = datetime.strptime(date_str, fmt)
-                    return dt.isoformat()
-                except ValueError:
-                    continue
-            
-            # If all parsing fails, return current time
-            return datetime.now().isoformat()
-            
-        except Exception:
-            return datetime.now().isoformat()
+        # Many entries in one feed share a date string, so parses are cached;
+        # unparseable dates fall back to the current time
+        return _parse_date_string(date_str) or datetime.now().isoformat()
     
-    def _remove_duplicates(self, articles: List[Dict]) -> List[Dict]:
+    def _remove_duplicates(self, articles: List[Article]) -> List[Article]:
         """Remove duplicate articles based on title similarity"""
         unique_articles = []
         seen_titles = set()
         
-        for article in articles:
-            title = article.get('title', '').lower().strip()
+        # Near-duplicate titles ("signs bill" / "signs new bill") need datasketch
+        lsh = None
+        if MinHashLSH is not None:
+            lsh = MinHashLSH(threshold=Config.DUPLICATE_TITLE_THRESHOLD, num_perm=MINHASH_PERMUTATIONS)
+        
+        for index, article in enumerate(articles):
+            title = article.title.lower().strip()
             
             # Create a simplified version for comparison
-            simplified_title = re.sub(r'[^\w\s]', '', title)
-            simplified_title = ' '.join(simplified_title.split())
+            simplified_title = ' '.join(title.translate(TITLE_PUNCTUATION_TABLE).split())
+            
+            if simplified_title in seen_titles or len(simplified_title) <= 10:
+                continue
+            
+            if lsh is not None:
+                # Character 3-gram shingles so a single inserted word still overlaps
+                minhash = MinHash(num_perm=MINHASH_PERMUTATIONS)
+                for i in range(len(simplified_title) - 2):
+                    minhash.update(simplified_title[i:i + 3].encode('utf-8'))
+                if lsh.query(minhash):
+                    continue
+                lsh.insert(index, minhash)
             
-            if simplified_title not in seen_titles and len(simplified_title) > 10:
-                seen_titles.add(simplified_title)
-                unique_articles.append(article)
+            seen_titles.add(simplified_title)
+            unique_articles.append(article)
         
         return unique_articles
\ No newline at end of file
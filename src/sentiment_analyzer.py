@@ -2,18 +2,89 @@ from vaderSentiment.vaderSentiment import SentimentIntensityAnalyzer
 from textblob import TextBlob
 import numpy as np
 import logging
-from typing import Dict, List, Tuple
+import multiprocessing
+import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple, Union
 from config import Config
 import re
 
 logger = logging.getLogger(__name__)
 
+# URLs and email addresses; both need a '://' or '@', so texts without either skip this pass
+LINK_RE = re.compile(
+    r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+    r'|\S+@\S+'
+)
+# Runs of special characters, keeping punctuation that affects sentiment
+SPECIAL_CHARS_RE = re.compile(r'[^\w\s.,!?;:-]+')
+WHITESPACE_RE = re.compile(r'\s+')
+MAX_TEXT_LENGTH = 512  # Characters passed to the models
+
+# Smaller batches score TextBlob in-process rather than paying for IPC
+PARALLEL_MIN_BATCH = 8
+
+# Column order of ensemble score arrays; argmax ties resolve in this order
+SENTIMENT_LABELS = ('positive', 'negative', 'neutral')
+
+# Ensemble models and their weights (higher weight = more trusted), in row order
+ENSEMBLE_MODELS = ('roberta', 'finbert', 'vader', 'textblob')
+ENSEMBLE_WEIGHTS = np.array([0.40, 0.30, 0.20, 0.10])
+
+# Accepted MODEL_DTYPE values
+MODEL_DTYPES = ('auto', 'float32', 'float16', 'bfloat16')
+
+@dataclass(slots=True)
+class SentimentResult:
+    """Ensemble sentiment for one text"""
+    sentiment: str
+    confidence: float
+    scores: Dict[str, float]
+    details: Union[Dict, str]
+    
+    def to_dict(self) -> Dict:
+        """Plain dict form for merging into articles and JSON responses"""
+        return {
+            'sentiment': self.sentiment,
+            'confidence': self.confidence,
+            'scores': self.scores,
+            'details': self.details
+        }
+
+# One VADER instance per process: the lexicon is read from disk on construction
+VADER_ANALYZER = SentimentIntensityAnalyzer()
+
+# Lexicon scores are cached on the preprocessed text, so re-analyzing the same
+# articles (dashboard refreshes, overlapping searches) skips both models
+@lru_cache(maxsize=4096)
+def _vader_scores(text: str) -> Dict:
+    """VADER polarity scores for one text"""
+    return VADER_ANALYZER.polarity_scores(text)
+
+@lru_cache(maxsize=4096)
+def _textblob_polarity(text: str) -> Optional[float]:
+    """TextBlob polarity for one text; runs in worker processes"""
+    try:
+        return TextBlob(text).sentiment.polarity
+    except Exception as e:
+        logger.error(f"TextBlob prediction error: {e}")
+        return None
+
 class SentimentAnalyzer:
     """High-accuracy sentiment analyzer using ensemble of available models"""
     
     def __init__(self):
         self.models = {}
-        self.vader_analyzer = SentimentIntensityAnalyzer()
+        self.compiled_models = {}  # model name -> batch size its graphs were captured for
+        self.vader_analyzer = VADER_ANALYZER
+        self._process_pool = None
+        self._process_pool_lock = threading.Lock()
+        # Before the models load torch, while the process is still single-threaded
+        self._start_process_pool()
         self._load_available_models()
     
     def _load_available_models(self):
@@ -22,12 +93,17 @@ class SentimentAnalyzer:
             # Try to load transformer models if available
             try:
                 from transformers import pipeline
-                logger.info("Loading RoBERTa sentiment model...")
-                self.models['roberta'] = pipeline(
-                    "sentiment-analysis",
-                    model="cardiffnlp/twitter-roberta-base-sentiment-latest",
-                    return_all_scores=True
-                )
+                if Config.QUANTIZED_MODEL_PATH:
+                    self.models['roberta'] = self._load_quantized_model(Config.QUANTIZED_MODEL_PATH)
+                else:
+                    logger.info("Loading RoBERTa sentiment model...")
+                    self.models['roberta'] = pipeline(
+                        "sentiment-analysis",
+                        model="cardiffnlp/twitter-roberta-base-sentiment-latest",
+                        return_all_scores=True,
+                        **self._device_settings()
+                    )
+                    self._compile_model('roberta')
                 logger.info("RoBERTa model loaded successfully")
             except Exception as e:
                 logger.warning(f"RoBERTa model not available: {e}")
@@ -39,8 +115,10 @@ class SentimentAnalyzer:
                 self.models['finbert'] = pipeline(
                     "sentiment-analysis",
                     model="ProsusAI/finbert",
-                    return_all_scores=True
+                    return_all_scores=True,
+                    **self._device_settings()
                 )
+                self._compile_model('finbert')
                 logger.info("FinBERT model loaded successfully")
             except Exception as e:
                 logger.warning(f"FinBERT model not available: {e}")
@@ -51,7 +129,71 @@ class SentimentAnalyzer:
         # Always have VADER and TextBlob as fallbacks
         logger.info("VADER and TextBlob models loaded successfully")
     
-    def analyze(self, text: str) -> Dict:
+    def _compile_model(self, model_name: str, batch_size: int = 32):
+        """Compile a GPU pipeline's model with CUDA graphs and warm up each length bucket"""
+        import torch
+        
+        if not Config.COMPILE_MODELS or not torch.cuda.is_available():
+            return
+        
+        model = self.models[model_name]
+        logger.info(f"Compiling {model_name} model for fixed batch shapes...")
+        model.model = torch.compile(model.model, mode='reduce-overhead', dynamic=False)
+        
+        # Capture a graph per bucket length up front instead of on the first requests
+        for max_length in Config.TOKEN_LENGTH_BUCKETS:
+            model(['warm up'] * batch_size, batch_size=batch_size,
+                  padding='max_length', truncation=True, max_length=max_length)
+        
+        self.compiled_models[model_name] = batch_size
+    
+    def _load_quantized_model(self, model_path: str):
+        """Load an int8 ONNX export of the RoBERTa model through ONNX Runtime"""
+        from optimum.onnxruntime import ORTModelForSequenceClassification
+        from transformers import AutoTokenizer, pipeline
+        
+        logger.info(f"Loading quantized RoBERTa model from {model_path}...")
+        model = ORTModelForSequenceClassification.from_pretrained(
+            model_path, provider='CPUExecutionProvider'
+        )
+        tokenizer = AutoTokenizer.from_pretrained(model_path)
+        return pipeline(
+            "sentiment-analysis",
+            model=model,
+            tokenizer=tokenizer,
+            return_all_scores=True
+        )
+    
+    def _device_settings(self) -> Dict:
+        """Pick device and reduced-precision dtype for transformer pipelines"""
+        try:
+            import torch
+        except ImportError:
+            return {}
+        
+        dtype_name = Config.MODEL_DTYPE.lower()
+        if dtype_name not in MODEL_DTYPES:
+            logger.warning(f"Invalid MODEL_DTYPE {Config.MODEL_DTYPE!r}, expected one of "
+                           f"{', '.join(MODEL_DTYPES)}; using auto")
+            dtype_name = 'auto'
+        
+        if torch.cuda.is_available():
+            device = 0
+            if dtype_name == 'auto':
+                # bf16 needs Ampere or newer; older GPUs get fp16 tensor cores
+                major, _ = torch.cuda.get_device_capability()
+                dtype_name = 'bfloat16' if major >= 8 else 'float16'
+        else:
+            device = -1
+            if dtype_name == 'auto':
+                # Half precision on CPU only pays off with AMX/AVX512-BF16
+                dtype_name = 'float32'
+        
+        dtype = getattr(torch, dtype_name)
+        logger.info(f"Transformer models will run on {'cuda' if device >= 0 else 'cpu'} as {dtype}")
+        return {'device': device, 'torch_dtype': dtype}
+    
+    def analyze(self, text: str) -> SentimentResult:
         """
         Analyze sentiment using available models
         
@@ -59,108 +201,182 @@ class SentimentAnalyzer:
             text: Text to analyze
             
         Returns:
-            Dictionary with sentiment results
+            SentimentResult with sentiment, confidence, scores and details
         """
-        if not text or len(text.strip()) < 10:
-            return {
-                'sentiment': 'neutral',
-                'confidence': 0.5,
-                'scores': {'positive': 0.33, 'negative': 0.33, 'neutral': 0.34},
-                'details': 'Text too short for analysis'
-            }
-        
-        # Preprocess text
-        cleaned_text = self._preprocess_text(text)
-        
-        # Get predictions from all available models
-        predictions = self._get_ensemble_predictions(cleaned_text)
-        
-        # Combine predictions using weighted ensemble
-        final_sentiment, confidence, scores = self._ensemble_combine(predictions)
-        
-        return {
-            'sentiment': final_sentiment,
-            'confidence': round(confidence, 3),
-            'scores': {
-                'positive': round(scores.get('positive', 0), 3),
-                'negative': round(scores.get('negative', 0), 3),
-                'neutral': round(scores.get('neutral', 0), 3)
+        return self.analyze_batch([text])[0]
+    
+    def _build_result(self, text: str, cleaned_text: str, predictions: Dict,
+                      sentiment: str, confidence: float, scores: np.ndarray) -> SentimentResult:
+        """Assemble the final result for one text"""
+        return SentimentResult(
+            sentiment=str(sentiment),
+            confidence=round(float(confidence), 3),
+            scores={
+                label: round(float(score), 3) for label, score in zip(SENTIMENT_LABELS, scores)
             },
-            'details': {
+            details={
                 'model_predictions': predictions,
                 'text_length': len(text),
                 'processed_length': len(cleaned_text),
                 'models_used': list(predictions.keys())
             }
-        }
+        )
     
     def _preprocess_text(self, text: str) -> str:
         """Preprocess text for better sentiment analysis"""
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        
-        # Remove email addresses
-        text = re.sub(r'\S+@\S+', '', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text)
-        
-        # Remove special characters but keep punctuation that affects sentiment
-        text = re.sub(r'[^\w\s.,!?;:-]', '', text)
-        
-        # Limit length for model processing
-        max_length = 512
-        if len(text) > max_length:
-            # Try to cut at sentence boundary
-            sentences = text.split('.')
-            truncated = ""
-            for sentence in sentences:
-                if len(truncated + sentence) < max_length:
-                    truncated += sentence + "."
-                else:
-                    break
-            text = truncated if truncated else text[:max_length]
+        # Remove URLs and email addresses
+        if '@' in text or '://' in text:
+            text = LINK_RE.sub('', text)
+        
+        # Remove special characters, then extra whitespace
+        text = WHITESPACE_RE.sub(' ', SPECIAL_CHARS_RE.sub('', text))
+        
+        # Most texts already fit the models
+        if len(text) <= MAX_TEXT_LENGTH:
+            return text.strip()
+        
+        # Cut at the last sentence boundary within the limit, else hard-cut
+        cut = text.rfind('.', 0, MAX_TEXT_LENGTH)
+        text = text[:cut + 1] if cut >= 0 else text[:MAX_TEXT_LENGTH]
         
         return text.strip()
     
-    def _get_ensemble_predictions(self, text: str) -> Dict:
-        """Get predictions from all available models"""
-        predictions = {}
+    def _get_ensemble_predictions(self, texts: List[str],
+                                  batch_size: int = 32) -> Tuple[List[Dict], np.ndarray, np.ndarray]:
+        """Get predictions from all available models for a batch of texts
         
-        # RoBERTa prediction (if available)
-        if 'roberta' in self.models:
+        Returns the per-text prediction dicts along with a (models, texts, labels)
+        score array and a (models, texts) mask of which predictions succeeded.
+        """
+        predictions = [{} for _ in texts]
+        score_matrix = np.zeros((len(ENSEMBLE_MODELS), len(texts), len(SENTIMENT_LABELS)))
+        present = np.zeros((len(ENSEMBLE_MODELS), len(texts)), dtype=bool)
+        row = {model_name: m for m, model_name in enumerate(ENSEMBLE_MODELS)}
+        
+        # Transformer predictions (if available), one batched call per model
+        normalizers = {
+            'roberta': (self._normalize_roberta_output, 'RoBERTa'),
+            'finbert': (self._normalize_finbert_output, 'FinBERT')
+        }
+        for model_name, (normalize, display_name) in normalizers.items():
+            if model_name not in self.models:
+                continue
             try:
-                roberta_result = self.models['roberta'](text)[0]
-                predictions['roberta'] = self._normalize_roberta_output(roberta_result)
+                model_results = self._run_transformer(
+                    self.models[model_name], texts, batch_size,
+                    fixed_batch_size=self.compiled_models.get(model_name)
+                )
+                m = row[model_name]
+                for n, result in enumerate(model_results):
+                    predictions[n][model_name], score_matrix[m, n] = normalize(result)
+                present[m] = True
             except Exception as e:
-                logger.error(f"RoBERTa prediction error: {e}")
+                logger.error(f"{display_name} prediction error: {e}")
+        
+        polarities = self._textblob_polarities(texts)
         
-        # FinBERT prediction (if available)
-        if 'finbert' in self.models:
+        vader_row, textblob_row = row['vader'], row['textblob']
+        for n, (text, textblob_polarity) in enumerate(zip(texts, polarities)):
+            # VADER prediction (always available)
             try:
-                finbert_result = self.models['finbert'](text)[0]
-                predictions['finbert'] = self._normalize_finbert_output(finbert_result)
+                vader_scores = _vader_scores(text)
+                predictions[n]['vader'], score_matrix[vader_row, n] = self._normalize_vader_output(vader_scores)
+                present[vader_row, n] = True
             except Exception as e:
-                logger.error(f"FinBERT prediction error: {e}")
-        
-        # VADER prediction (always available)
-        try:
-            vader_scores = self.vader_analyzer.polarity_scores(text)
-            predictions['vader'] = self._normalize_vader_output(vader_scores)
-        except Exception as e:
                 logger.error(f"VADER prediction error: {e}")
+            
+            # TextBlob prediction (always available)
+            if textblob_polarity is not None:
+                predictions[n]['textblob'], score_matrix[textblob_row, n] = \
+                    self._normalize_textblob_output(textblob_polarity)
+                present[textblob_row, n] = True
         
-        # TextBlob prediction (always available)
-        try:
-            blob = TextBlob(text)
-            textblob_polarity = blob.sentiment.polarity
-            predictions['textblob'] = self._normalize_textblob_output(textblob_polarity)
-        except Exception as e:
-            logger.error(f"TextBlob prediction error: {e}")
+        return predictions, score_matrix, present
+    
+    def _start_process_pool(self):
+        """Start the TextBlob worker processes; TEXTBLOB_WORKERS=0 keeps scoring in-process"""
+        if Config.TEXTBLOB_WORKERS <= 0:
+            return
+        
+        # Fork where available: spawned workers would re-import the entry module
+        # and load the transformer models again in every process. Forking is only
+        # safe before torch is imported and before any threads start, so the
+        # workers are launched here, at construction, rather than on first use.
+        mp_context = None
+        if 'fork' in multiprocessing.get_all_start_methods():
+            mp_context = multiprocessing.get_context('fork')
+        process_pool = ProcessPoolExecutor(max_workers=Config.TEXTBLOB_WORKERS, mp_context=mp_context)
+        
+        # One task per worker launches them all now (Python 3.11+ does this on the
+        # first submit for fork pools; 3.10 adds a worker per submit)
+        for future in [process_pool.submit(os.getpid) for _ in range(Config.TEXTBLOB_WORKERS)]:
+            future.result()
+        self._process_pool = process_pool
+    
+    def _textblob_polarities(self, texts: List[str]) -> List[Optional[float]]:
+        """TextBlob polarity per text; large batches go to the worker processes"""
+        # TextBlob is CPU-bound pure Python, so the pool sidesteps the GIL
+        process_pool = self._process_pool
+        if process_pool is not None and len(texts) >= PARALLEL_MIN_BATCH:
+            try:
+                return list(process_pool.map(
+                    _textblob_polarity, texts,
+                    chunksize=max(1, len(texts) // (4 * Config.TEXTBLOB_WORKERS))
+                ))
+            except (BrokenProcessPool, RuntimeError) as e:
+                # A dead worker breaks the pool for good, so score in-process from now on
+                logger.error(f"TextBlob worker pool failed, scoring in-process: {e}")
+                with self._process_pool_lock:
+                    if self._process_pool is process_pool:
+                        self._process_pool = None
+                process_pool.shutdown(wait=False)
+        
+        return [_textblob_polarity(text) for text in texts]
+    
+    def close(self):
+        """Shut down the TextBlob worker processes"""
+        with self._process_pool_lock:
+            if self._process_pool is not None:
+                self._process_pool.shutdown()
+                self._process_pool = None
+    
+    def _run_transformer(self, model, texts: List[str], batch_size: int,
+                         fixed_batch_size: Optional[int] = None) -> List[List[Dict]]:
+        """Run a transformer pipeline over texts in token-length buckets to minimize padding"""
+        # Tokenize once to get lengths, then group similar lengths together
+        input_ids = model.tokenizer(texts, truncation=True)['input_ids']
+        lengths = np.array([len(ids) for ids in input_ids])
+        order = np.argsort(lengths, kind='stable')
+        sorted_lengths = lengths[order]
+        
+        results = [None] * len(texts)
+        start = 0
+        bounds = list(Config.TOKEN_LENGTH_BUCKETS) + [int(sorted_lengths[-1])]
+        for upper in bounds:
+            end = int(np.searchsorted(sorted_lengths, upper, side='right'))
+            if end <= start:
+                continue
+            
+            # Each bucket is its own pass, padded only to its longest member;
+            # compiled models pad to the bucket bound and fill the last batch with
+            # blanks so every batch has the captured shape and replays its graph
+            bucket = order[start:end]
+            if fixed_batch_size:
+                bucket_texts = [texts[i] for i in bucket]
+                bucket_texts += [''] * (-len(bucket_texts) % fixed_batch_size)
+                bucket_results = model(bucket_texts, batch_size=fixed_batch_size,
+                                       padding='max_length', truncation=True, max_length=upper)
+            else:
+                bucket_results = model([texts[i] for i in bucket], batch_size=batch_size)
+            
+            # Scatter results back to the original order
+            for i, result in zip(bucket, bucket_results):
+                results[i] = result
+            start = end
         
-        return predictions
+        return results
     
-    def _normalize_roberta_output(self, result: List[Dict]) -> Dict:
+    def _normalize_roberta_output(self, result: List[Dict]) -> Tuple[Dict, np.ndarray]:
         """Normalize RoBERTa output to standard format"""
         scores = {item['label'].lower(): item['score'] for item in result}
         
@@ -184,9 +400,9 @@ class SentimentAnalyzer:
             'sentiment': sentiment,
             'confidence': confidence,
             'scores': normalized_scores
-        }
+        }, self._score_vector(normalized_scores)
     
-    def _normalize_finbert_output(self, result: List[Dict]) -> Dict:
+    def _normalize_finbert_output(self, result: List[Dict]) -> Tuple[Dict, np.ndarray]:
         """Normalize FinBERT output to standard format"""
         scores = {item['label'].lower(): item['score'] for item in result}
         sentiment = max(scores, key=scores.get)
@@ -196,9 +412,9 @@ class SentimentAnalyzer:
             'sentiment': sentiment,
             'confidence': confidence,
             'scores': scores
-        }
+        }, self._score_vector(scores)
     
-    def _normalize_vader_output(self, vader_scores: Dict) -> Dict:
+    def _normalize_vader_output(self, vader_scores: Dict) -> Tuple[Dict, np.ndarray]:
         """Normalize VADER output to standard format"""
         compound = vader_scores['compound']
         
@@ -215,19 +431,23 @@ class SentimentAnalyzer:
         
         # Normalize scores
         total = vader_scores['pos'] + vader_scores['neu'] + vader_scores['neg']
-        scores = {
-            'positive': vader_scores['pos'] / total if total > 0 else 0,
-            'neutral': vader_scores['neu'] / total if total > 0 else 0,
-            'negative': vader_scores['neg'] / total if total > 0 else 0
-        }
+        vector = np.array([vader_scores['pos'], vader_scores['neg'], vader_scores['neu']])
+        if total > 0:
+            vector /= total
+        else:
+            vector[:] = 0
         
         return {
             'sentiment': sentiment,
             'confidence': confidence,
-            'scores': scores
-        }
+            'scores': {
+                'positive': float(vector[0]),
+                'neutral': float(vector[2]),
+                'negative': float(vector[1])
+            }
+        }, vector
     
-    def _normalize_textblob_output(self, polarity: float) -> Dict:
+    def _normalize_textblob_output(self, polarity: float) -> Tuple[Dict, np.ndarray]:
         """Normalize TextBlob output to standard format"""
         if polarity > 0.1:
             sentiment = 'positive'
@@ -254,55 +474,69 @@ class SentimentAnalyzer:
             'sentiment': sentiment,
             'confidence': confidence,
             'scores': scores
-        }
+        }, np.array([pos_score, neg_score, neu_score])
     
-    def _ensemble_combine(self, predictions: Dict) -> Tuple[str, float, Dict]:
-        """Combine predictions using weighted ensemble"""
-        if not predictions:
-            return 'neutral', 0.5, {'positive': 0.33, 'negative': 0.33, 'neutral': 0.34}
-        
-        # Model weights (higher weight = more trusted)
-        weights = {
-            'roberta': 0.40,      # Highest weight for RoBERTa
-            'finbert': 0.30,      # High weight for FinBERT
-            'vader': 0.20,        # Good weight for VADER
-            'textblob': 0.10      # Lower weight for TextBlob
-        }
+    @staticmethod
+    def _score_vector(scores: Dict) -> np.ndarray:
+        """Scores dict as an array in SENTIMENT_LABELS order"""
+        return np.array([scores.get(label, 0) for label in SENTIMENT_LABELS])
+    
+    def _ensemble_combine(self, score_matrix: np.ndarray,
+                          present: np.ndarray) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """Combine predictions using weighted ensemble, vectorized over the batch"""
+        # A model that failed for a text contributes zero weight to it
+        model_weights = present * ENSEMBLE_WEIGHTS[:, None]
+        
+        # Weighted sum over models, normalized by the weight actually present
+        total_weight = model_weights.sum(axis=0)
+        combined = np.einsum('mn,mnk->nk', model_weights, score_matrix)
+        combined /= np.where(total_weight > 0, total_weight, 1)[:, None]
+        combined[total_weight == 0] = [0.33, 0.33, 0.34]
+        
+        # Determine final sentiment and confidence
+        best = combined.argmax(axis=1)
+        sentiments = np.array(SENTIMENT_LABELS)[best]
+        confidences = combined[np.arange(len(combined)), best]
         
-        # Initialize combined scores
-        combined_scores = {'positive': 0.0, 'negative': 0.0, 'neutral': 0.0}
-        total_weight = 0.0
+        # Apply confidence threshold: if confidence is too low, classify as neutral
+        low_confidence = confidences < Config.CONFIDENCE_THRESHOLD
+        sentiments[low_confidence] = 'neutral'
+        confidences[low_confidence] = np.maximum(combined[low_confidence, 2], 0.5)
         
-        # Combine predictions
-        for model_name, prediction in predictions.items():
-            weight = weights.get(model_name, 0.1)
-            total_weight += weight
-            
-            for sentiment, score in prediction['scores'].items():
-                combined_scores[sentiment] += score * weight
+        return sentiments, confidences, combined
+    
+    def analyze_batch(self, texts: List[str], batch_size: int = 32) -> List[SentimentResult]:
+        """Analyze sentiment for multiple texts with batched model inference"""
+        results = [None] * len(texts)
+        pending = []
+        
+        for i, text in enumerate(texts):
+            if not text or len(text.strip()) < 10:
+                results[i] = SentimentResult(
+                    sentiment='neutral',
+                    confidence=0.5,
+                    scores={'positive': 0.33, 'negative': 0.33, 'neutral': 0.34},
+                    details='Text too short for analysis'
+                )
+            else:
+                pending.append(i)
         
-        # Normalize combined scores
-        if total_weight > 0:
-            for sentiment in combined_scores:
-                combined_scores[sentiment] /= total_weight
+        if not pending:
+            return results
         
-        # Determine final sentiment and confidence
-        final_sentiment = max(combined_scores, key=combined_scores.get)
-        confidence = combined_scores[final_sentiment]
+        # Preprocess text
+        cleaned_texts = [self._preprocess_text(texts[i]) for i in pending]
         
-        # Apply confidence threshold
-        if confidence < Config.CONFIDENCE_THRESHOLD:
-            # If confidence is too low, classify as neutral
-            final_sentiment = 'neutral'
-            confidence = max(combined_scores['neutral'], 0.5)
+        # Get predictions from all available models
+        predictions, score_matrix, present = self._get_ensemble_predictions(cleaned_texts, batch_size)
+        
+        sentiments, confidences, scores = self._ensemble_combine(score_matrix, present)
+        
+        for j, i in enumerate(pending):
+            results[i] = self._build_result(
+                texts[i], cleaned_texts[j], predictions[j], sentiments[j], confidences[j], scores[j]
+            )
         
-        return final_sentiment, confidence, combined_scores
-    
-    def analyze_batch(self, texts: List[str]) -> List[Dict]:
-        """Analyze sentiment for multiple texts"""
-        results = []
-        for text in texts:
-            results.append(self.analyze(text))
         return results
     
     def get_model_info(self) -> Dict:
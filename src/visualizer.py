@@ -1,21 +1,131 @@
 import plotly.graph_objs as go
-import plotly.express as px
-from plotly.utils import PlotlyJSONEncoder
-import json
+from plotly.colors import qualitative
+import plotly.io as pio
+import orjson
+import base64
+import numpy as np
 import pandas as pd
-from datetime import datetime, timedelta
-from typing import Dict, List
-from src.data_manager import DataManager
+import threading
+from cachetools import TTLCache
+from cachetools.keys import hashkey
+from concurrent.futures import ThreadPoolExecutor
+from functools import wraps
+from typing import Dict, List, Union
+from config import Config
+from src.data_manager import DataManager, CONFIDENCE_BINS
 import logging
 
 logger = logging.getLogger(__name__)
 
-def create_sentiment_chart(keyword: str, days: int = 7) -> Dict:
-    """Create sentiment distribution pie chart"""
+# Static image export for dashboard tiles (optional)
+try:
+    import kaleido
+except ImportError:
+    kaleido = None
+
+# Shared styling; dict-built figures reference these objects directly, so never mutate them
+SENTIMENT_COLORS = {
+    'positive': '#28a745',
+    'negative': '#dc3545',
+    'neutral': '#6c757d'
+}
+_LEGEND_H = dict(orientation="h", yanchor="bottom", y=1.02, xanchor="right", x=1)
+_MARGIN_STD = dict(t=80, b=50, l=50, r=20)
+_MARGIN_COMPACT = dict(t=60, b=50, l=50, r=20)
+_MARGIN_PIE = dict(t=80, b=20, l=20, r=20)
+# Trend columns plotted by create_trend_chart, in trace order
+TREND_SERIES = ('positive_pct', 'negative_pct', 'neutral_pct')
+_GRID = dict(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
+
+# The template go.Figure would attach, resolved once and shared by every _figure
+_TEMPLATE = pio.templates[pio.templates.default].to_plotly_json()
+
+# One DataManager (and so one SQLite connection) shared by every chart
+_data_manager = None
+_data_manager_lock = threading.Lock()
+
+def _get_data_manager() -> DataManager:
+    """Create the shared DataManager on first use"""
+    global _data_manager
+    with _data_manager_lock:
+        if _data_manager is None:
+            _data_manager = DataManager()
+        return _data_manager
+
+# Built charts keyed by (function, data version, arguments)
+_chart_cache = TTLCache(maxsize=256, ttl=Config.CHART_CACHE_TIMEOUT)
+_chart_cache_lock = threading.Lock()
+
+def _cached_chart(func):
+    """Reuse a chart function's result until new data is stored or the TTL expires"""
+    @wraps(func)
+    def wrapper(*args, **kwargs):
+        # Lists (keyword comparisons) are not hashable
+        key_args = tuple(tuple(arg) if isinstance(arg, list) else arg for arg in args)
+        key = hashkey(func.__name__, DataManager.data_version, *key_args, **kwargs)
+        with _chart_cache_lock:
+            if key in _chart_cache:
+                return _chart_cache[key]
+        
+        result = func(*args, **kwargs)
+        
+        # Errors may be transient (failed lookups come back empty), so only
+        # successful results are kept
+        if result and 'error' not in result:
+            with _chart_cache_lock:
+                _chart_cache[key] = result
+        return result
+    return wrapper
+
+def _lttb(x: np.ndarray, y: np.ndarray, n_out: int) -> np.ndarray:
+    """Pick n_out point indices with Largest-Triangle-Three-Buckets downsampling"""
+    n = len(x)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept; the rest are split into buckets
+    buckets = np.array_split(np.arange(1, n - 1), n_out - 2)
+    selected = np.empty(n_out, dtype=np.int64)
+    selected[0], selected[-1] = 0, n - 1
+    
+    a = 0
+    for i, bucket in enumerate(buckets):
+        following = buckets[i + 1] if i + 1 < len(buckets) else np.array([n - 1])
+        avg_x, avg_y = x[following].mean(), y[following].mean()
+        # Twice the triangle area (previous pick, candidate, next bucket's mean)
+        areas = np.abs((x[a] - avg_x) * (y[bucket] - y[a]) - (x[a] - x[bucket]) * (avg_y - y[a]))
+        a = bucket[np.argmax(areas)]
+        selected[i + 1] = a
+    
+    return selected
+
+def _downsample_trends(trends: List[Dict]) -> List[Dict]:
+    """Keep the trend rows LTTB selects for any plotted series, at most TREND_MAX_POINTS"""
+    tdf = pd.DataFrame(trends)
+    x = pd.to_datetime(tdf['date']).to_numpy().astype(np.int64).astype(np.float64)
+    per_series = Config.TREND_MAX_POINTS // len(TREND_SERIES)
+    
+    keep = set()
+    for column in TREND_SERIES:
+        keep.update(_lttb(x, tdf[column].to_numpy(dtype=np.float64), per_series).tolist())
+    return [trends[i] for i in sorted(keep)]
+
+def _figure(data: List[Dict], layout: Dict) -> Dict:
+    """Assemble a figure from raw trace and layout dicts, skipping Plotly's validators"""
+    return {'data': data, 'layout': {**layout, 'template': _TEMPLATE}}
+
+def _figure_to_dict(fig: Union[go.Figure, Dict]) -> Dict:
+    """Serialize a figure with orjson and return it as plain JSON-compatible data"""
+    return orjson.loads(pio.to_json(fig, validate=False, engine='orjson'))
+
+@_cached_chart
+def compute_sentiment_stats(keyword: str = None, days: int = 7) -> Dict:
+    """Get sentiment counts and percentages without building a chart"""
+    return _get_data_manager().get_summary_stats(keyword, days)
+
+def render_sentiment_chart(stats: Dict, keyword: str) -> Dict:
+    """Create sentiment distribution pie chart from precomputed stats"""
     try:
-        data_manager = DataManager()
-        stats = data_manager.get_summary_stats(keyword, days)
-        
         if stats.get('total_articles', 0) == 0:
             return {'error': 'No data available for the specified period'}
         
@@ -26,21 +136,18 @@ def create_sentiment_chart(keyword: str, days: int = 7) -> Dict:
             stats.get('negative_count', 0),
             stats.get('neutral_count', 0)
         ]
-        colors = ['#28a745', '#dc3545', '#6c757d']
-        
-        fig = go.Figure(data=[go.Pie(
+        fig = _figure([dict(
+            type='pie',
             labels=labels,
             values=values,
             hole=0.4,
-            marker_colors=colors,
+            marker=dict(colors=list(SENTIMENT_COLORS.values())),
             textinfo='label+percent+value',
-            textfont_size=12,
+            textfont=dict(size=12),
             hovertemplate='<b>%{label}</b><br>Count: %{value}<br>Percentage: %{percent}<extra></extra>'
-        )])
-        
-        fig.update_layout(
+        )], dict(
             title={
-                'text': f'Sentiment Distribution for "{keyword}"<br><sub>Last {days} days - {stats["total_articles"]} articles</sub>',
+                'text': f'Sentiment Distribution for "{keyword}"<br><sub>Last {stats["period_days"]} days - {stats["total_articles"]} articles</sub>',
                 'x': 0.5,
                 'xanchor': 'center',
                 'font': {'size': 16}
@@ -48,11 +155,11 @@ def create_sentiment_chart(keyword: str, days: int = 7) -> Dict:
             showlegend=True,
             width=500,
             height=400,
-            margin=dict(t=80, b=20, l=20, r=20)
-        )
+            margin=_MARGIN_PIE
+        ))
         
         return {
-            'chart': json.loads(json.dumps(fig, cls=PlotlyJSONEncoder)),
+            'chart': _figure_to_dict(fig),
             'stats': stats
         }
         
@@ -60,209 +167,205 @@ def create_sentiment_chart(keyword: str, days: int = 7) -> Dict:
         logger.error(f"Error creating sentiment chart: {e}")
         return {'error': str(e)}
 
+@_cached_chart
+def create_sentiment_chart(keyword: str, days: int = 7) -> Dict:
+    """Create sentiment distribution pie chart"""
+    return render_sentiment_chart(compute_sentiment_stats(keyword, days), keyword)
+
+@_cached_chart
 def create_trend_chart(keyword: str, days: int = 7) -> Dict:
-    """Create sentiment trend line chart"""
+    """Create sentiment trend line chart
+    
+    The points are sent once, in 'trends'; the chart's traces carry no x/y and
+    are filled on the client from the trend columns named in 'series'.
+    """
     try:
-        data_manager = DataManager()
+        data_manager = _get_data_manager()
         trends_data = data_manager.get_trends(keyword, days)
         
         if not trends_data.get('trends'):
             return {'error': 'No trend data available for the specified period'}
         
-        trends = trends_data['trends']
-        
-        # Prepare data
-        dates = [trend['date'] for trend in trends]
-        positive_pcts = [trend['positive_pct'] for trend in trends]
-        negative_pcts = [trend['negative_pct'] for trend in trends]
-        neutral_pcts = [trend['neutral_pct'] for trend in trends]
+        # Long histories are thinned so the browser draws a bounded number of points
+        original_points = len(trends_data['trends'])
+        if original_points > Config.TREND_MAX_POINTS:
+            trends_data = {**trends_data, 'trends': _downsample_trends(trends_data['trends'])}
         
         # Create line chart
-        fig = go.Figure()
+        traces = []
         
-        fig.add_trace(go.Scatter(
-            x=dates, y=positive_pcts,
+        traces.append(dict(
+            type='scattergl',
             mode='lines+markers',
             name='Positive',
-            line=dict(color='#28a745', width=3),
+            line=dict(color=SENTIMENT_COLORS['positive'], width=3),
             marker=dict(size=8),
             hovertemplate='Date: %{x}<br>Positive: %{y:.1f}%<extra></extra>'
         ))
         
-        fig.add_trace(go.Scatter(
-            x=dates, y=negative_pcts,
+        traces.append(dict(
+            type='scattergl',
             mode='lines+markers',
             name='Negative',
-            line=dict(color='#dc3545', width=3),
+            line=dict(color=SENTIMENT_COLORS['negative'], width=3),
             marker=dict(size=8),
             hovertemplate='Date: %{x}<br>Negative: %{y:.1f}%<extra></extra>'
         ))
         
-        fig.add_trace(go.Scatter(
-            x=dates, y=neutral_pcts,
+        traces.append(dict(
+            type='scattergl',
             mode='lines+markers',
             name='Neutral',
-            line=dict(color='#6c757d', width=3),
+            line=dict(color=SENTIMENT_COLORS['neutral'], width=3),
             marker=dict(size=8),
             hovertemplate='Date: %{x}<br>Neutral: %{y:.1f}%<extra></extra>'
         ))
         
-        fig.update_layout(
+        fig = _figure(traces, dict(
             title={
                 'text': f'Sentiment Trends for "{keyword}"<br><sub>Last {days} days</sub>',
                 'x': 0.5,
                 'xanchor': 'center',
                 'font': {'size': 16}
             },
-            xaxis_title='Date',
-            yaxis_title='Percentage (%)',
+            xaxis={'title': {'text': 'Date'}, **_GRID},
+            yaxis={'title': {'text': 'Percentage (%)'}, 'range': [0, 100], **_GRID},
             hovermode='x unified',
             width=800,
             height=400,
-            margin=dict(t=80, b=50, l=50, r=20),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
-        )
-        
-        # Style the chart
-        fig.update_xaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)')
-        fig.update_yaxes(showgrid=True, gridwidth=1, gridcolor='rgba(128,128,128,0.2)', range=[0, 100])
+            margin=_MARGIN_STD,
+            legend=_LEGEND_H
+        ))
         
         return {
-            'chart': json.loads(json.dumps(fig, cls=PlotlyJSONEncoder)),
-            'trends': trends_data
+            'chart': _figure_to_dict(fig),
+            'series': {'x': 'date', 'y': list(TREND_SERIES)},
+            'trends': trends_data,
+            'downsampled': len(trends_data['trends']) < original_points,
+            'original_points': original_points
         }
         
     except Exception as e:
         logger.error(f"Error creating trend chart: {e}")
         return {'error': str(e)}
 
+@_cached_chart
 def create_volume_chart(days: int = 7) -> Dict:
     """Create article volume chart by source"""
     try:
-        data_manager = DataManager()
-        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
+        data_manager = _get_data_manager()
         
         # Get volume data by source
-        import sqlite3
-        with sqlite3.connect(data_manager.db_path) as conn:
-            query = '''
-                SELECT 
-                    source,
-                    date(created_at) as date,
-                    COUNT(*) as article_count
-                FROM analysis_results 
-                WHERE date(created_at) >= ?
-                GROUP BY source, date(created_at)
-                ORDER BY date(created_at), source
-            '''
-            
-            df = pd.read_sql_query(query, conn, params=[cutoff_date])
+        df = pd.DataFrame(data_manager.get_source_volume(days))
         
         if df.empty:
             return {'error': 'No volume data available'}
         
-        # Create stacked bar chart
-        fig = px.bar(
-            df, 
-            x='date', 
-            y='article_count', 
-            color='source',
-            title=f'Article Volume by Source (Last {days} days)',
-            labels={'article_count': 'Number of Articles', 'date': 'Date'},
-            color_discrete_sequence=px.colors.qualitative.Set3
-        )
-        
-        fig.update_layout(
-            xaxis_title='Date',
-            yaxis_title='Number of Articles',
-            title_x=0.5,
+        # groupby drops NaN keys, so articles without a source get their own bar
+        df['source'] = df['source'].fillna('Unknown')
+        
+        # Create stacked bar chart, one trace per source
+        traces = []
+        for i, (source, group) in enumerate(df.groupby('source', sort=False)):
+            traces.append(dict(
+                type='bar',
+                name=source,
+                x=group['date'].to_numpy(),
+                y=group['article_count'].to_numpy(),
+                marker=dict(color=qualitative.Set3[i % len(qualitative.Set3)]),
+                hovertemplate=f'source={source}<br>Date=%{{x}}<br>Number of Articles=%{{y}}<extra></extra>'
+            ))
+        
+        fig = _figure(traces, dict(
+            title={'text': f'Article Volume by Source (Last {days} days)', 'x': 0.5},
+            barmode='relative',
+            legend={'title': {'text': 'source'}},
+            xaxis={'title': {'text': 'Date'}},
+            yaxis={'title': {'text': 'Number of Articles'}},
             width=800,
             height=400,
-            margin=dict(t=60, b=50, l=50, r=20)
-        )
+            margin=_MARGIN_COMPACT
+        ))
         
         return {
-            'chart': json.loads(json.dumps(fig, cls=PlotlyJSONEncoder)),
-            'data': df.to_dict('records')
+            'chart': _figure_to_dict(fig),
+            # Column-oriented: {'source': [...], 'date': [...], 'article_count': [...]}
+            'data': {column: df[column].tolist() for column in df.columns}
         }
         
     except Exception as e:
         logger.error(f"Error creating volume chart: {e}")
         return {'error': str(e)}
 
+@_cached_chart
 def create_confidence_distribution(keyword: str = None, days: int = 7) -> Dict:
     """Create confidence score distribution histogram"""
     try:
-        data_manager = DataManager()
-        cutoff_date = (datetime.now() - timedelta(days=days)).strftime('%Y-%m-%d')
-        
-        import sqlite3
-        with sqlite3.connect(data_manager.db_path) as conn:
-            where_clause = "WHERE date(created_at) >= ?"
-            params = [cutoff_date]
-            
-            if keyword:
-                where_clause += " AND keywords LIKE ?"
-                params.append(f'%{keyword}%')
-            
-            query = f'''
-                SELECT confidence, sentiment
-                FROM analysis_results {where_clause}
-            '''
-            
-            df = pd.read_sql_query(query, conn, params=params)
+        data_manager = _get_data_manager()
+        # Binned and counted in SQL: at most CONFIDENCE_BINS rows per sentiment
+        df = pd.DataFrame(data_manager.get_confidence_histogram(keyword, days))
         
         if df.empty:
             return {'error': 'No confidence data available'}
         
-        # Create histogram
-        fig = px.histogram(
-            df, 
-            x='confidence', 
-            color='sentiment',
-            title=f'Confidence Score Distribution{f" for {keyword}" if keyword else ""} (Last {days} days)',
-            labels={'confidence': 'Confidence Score', 'count': 'Number of Articles'},
-            color_discrete_map={
-                'positive': '#28a745',
-                'negative': '#dc3545', 
-                'neutral': '#6c757d'
+        bin_width = 1 / CONFIDENCE_BINS
+        # Dividing (rather than multiplying by bin_width) keeps centres like 0.075 exact
+        df['bin_center'] = (df['bin'] + 0.5) / CONFIDENCE_BINS
+        
+        # Create stacked histogram from the pre-binned counts
+        traces = []
+        for sentiment, color in SENTIMENT_COLORS.items():
+            sentiment_bins = df[df['sentiment'] == sentiment]
+            if sentiment_bins.empty:
+                continue
+            traces.append(dict(
+                type='bar',
+                name=sentiment,
+                x=sentiment_bins['bin_center'].to_numpy(),
+                y=sentiment_bins['article_count'].to_numpy(),
+                width=bin_width,
+                marker=dict(color=color),
+                hovertemplate='Confidence: %{x:.2f}<br>Articles: %{y}<extra></extra>'
+            ))
+        
+        total_articles = int(df['article_count'].sum())
+        
+        fig = _figure(traces, dict(
+            title={
+                'text': f'Confidence Score Distribution{f" for {keyword}" if keyword else ""} (Last {days} days)',
+                'x': 0.5
             },
-            nbins=20
-        )
-        
-        fig.update_layout(
-            xaxis_title='Confidence Score',
-            yaxis_title='Number of Articles',
-            title_x=0.5,
+            barmode='stack',
+            bargap=0,
+            xaxis={'title': {'text': 'Confidence Score'}},
+            yaxis={'title': {'text': 'Number of Articles'}},
             width=700,
             height=400,
-            margin=dict(t=60, b=50, l=50, r=20)
-        )
+            margin=_MARGIN_COMPACT
+        ))
         
         return {
-            'chart': json.loads(json.dumps(fig, cls=PlotlyJSONEncoder)),
-            'avg_confidence': df['confidence'].mean(),
-            'total_articles': len(df)
+            'chart': _figure_to_dict(fig),
+            'avg_confidence': float((df['avg_confidence'] * df['article_count']).sum() / total_articles),
+            'total_articles': total_articles
         }
         
     except Exception as e:
         logger.error(f"Error creating confidence distribution: {e}")
         return {'error': str(e)}
 
+@_cached_chart
 def create_keyword_comparison(keywords_list: List[str], days: int = 7) -> Dict:
     """Create comparison chart between multiple keywords"""
     try:
-        data_manager = DataManager()
+        data_manager = _get_data_manager()
+        
+        # All keywords' stats in one query; keywords without data are absent
+        keyword_stats = data_manager.get_summary_stats_batch(keywords_list, days)
         
         comparison_data = []
-        for keyword in keywords_list:
-            stats = data_manager.get_summary_stats(keyword, days)
+        for keyword in dict.fromkeys(keywords_list):
+            stats = keyword_stats.get(keyword, {})
             if stats.get('total_articles', 0) > 0:
                 comparison_data.append({
                     'keyword': keyword,
@@ -279,56 +382,53 @@ def create_keyword_comparison(keywords_list: List[str], days: int = 7) -> Dict:
         df = pd.DataFrame(comparison_data)
         
         # Create grouped bar chart
-        fig = go.Figure()
+        traces = []
         
-        fig.add_trace(go.Bar(
+        traces.append(dict(
+            type='bar',
             name='Positive',
             x=df['keyword'],
             y=df['positive_pct'],
-            marker_color='#28a745',
+            marker=dict(color=SENTIMENT_COLORS['positive']),
             hovertemplate='Keyword: %{x}<br>Positive: %{y:.1f}%<extra></extra>'
         ))
         
-        fig.add_trace(go.Bar(
+        traces.append(dict(
+            type='bar',
             name='Negative',
             x=df['keyword'],
             y=df['negative_pct'],
-            marker_color='#dc3545',
+            marker=dict(color=SENTIMENT_COLORS['negative']),
             hovertemplate='Keyword: %{x}<br>Negative: %{y:.1f}%<extra></extra>'
         ))
         
-        fig.add_trace(go.Bar(
+        traces.append(dict(
+            type='bar',
             name='Neutral',
             x=df['keyword'],
             y=df['neutral_pct'],
-            marker_color='#6c757d',
+            marker=dict(color=SENTIMENT_COLORS['neutral']),
             hovertemplate='Keyword: %{x}<br>Neutral: %{y:.1f}%<extra></extra>'
         ))
         
-        fig.update_layout(
+        fig = _figure(traces, dict(
             title={
                 'text': f'Keyword Sentiment Comparison (Last {days} days)',
                 'x': 0.5,
                 'xanchor': 'center',
                 'font': {'size': 16}
             },
-            xaxis_title='Keywords',
-            yaxis_title='Percentage (%)',
+            xaxis={'title': {'text': 'Keywords'}},
+            yaxis={'title': {'text': 'Percentage (%)'}},
             barmode='group',
             width=800,
             height=500,
-            margin=dict(t=80, b=50, l=50, r=20),
-            legend=dict(
-                orientation="h",
-                yanchor="bottom",
-                y=1.02,
-                xanchor="right",
-                x=1
-            )
-        )
+            margin=_MARGIN_STD,
+            legend=_LEGEND_H
+        ))
         
         return {
-            'chart': json.loads(json.dumps(fig, cls=PlotlyJSONEncoder)),
+            'chart': _figure_to_dict(fig),
             'comparison_data': comparison_data
         }
         
@@ -336,13 +436,25 @@ def create_keyword_comparison(keywords_list: List[str], days: int = 7) -> Dict:
         logger.error(f"Error creating keyword comparison: {e}")
         return {'error': str(e)}
 
-def create_summary_dashboard(days: int = 7) -> Dict:
-    """Create a comprehensive dashboard summary"""
+def _chart_to_png(chart: Dict) -> Dict:
+    """Replace a chart result's Plotly JSON with a base64-encoded PNG snapshot"""
+    png = pio.to_image(chart['chart'], format='png', engine='kaleido')
+    snapshot = {key: value for key, value in chart.items() if key != 'chart'}
+    snapshot['image'] = base64.b64encode(png).decode()
+    return snapshot
+
+@_cached_chart
+def create_summary_dashboard(days: int = 7, render: str = 'json') -> Dict:
+    """Create a comprehensive dashboard summary; render='png' returns static chart images"""
     try:
-        data_manager = DataManager()
+        if render == 'png' and kaleido is None:
+            logger.warning("kaleido is not installed; returning interactive dashboard charts")
+            render = 'json'
+        
+        data_manager = _get_data_manager()
         
         # Get overall stats
-        overall_stats = data_manager.get_summary_stats(days=days)
+        overall_stats = compute_sentiment_stats(days=days)
         top_keywords = data_manager.get_top_keywords(days=days, limit=5)
         
         # Create combined visualization
@@ -352,22 +464,24 @@ def create_summary_dashboard(days: int = 7) -> Dict:
             'charts': {}
         }
         
-        # Add volume chart
-        volume_chart = create_volume_chart(days)
-        if 'chart' in volume_chart:
-            dashboard_data['charts']['volume'] = volume_chart
-        
-        # Add confidence distribution
-        confidence_chart = create_confidence_distribution(days=days)
-        if 'chart' in confidence_chart:
-            dashboard_data['charts']['confidence'] = confidence_chart
-        
-        # Add top keywords comparison if we have data
-        if top_keywords:
-            keywords_list = [kw['keywords'] for kw in top_keywords[:3]]
-            comparison_chart = create_keyword_comparison(keywords_list, days)
-            if 'chart' in comparison_chart:
-                dashboard_data['charts']['comparison'] = comparison_chart
+        # Build the sub-charts concurrently; queries share the DataManager's
+        # locked connection, so the overlap is mostly in figure serialization
+        with ThreadPoolExecutor(max_workers=3) as executor:
+            futures = {
+                'volume': executor.submit(create_volume_chart, days),
+                'confidence': executor.submit(create_confidence_distribution, days=days)
+            }
+            
+            # Add top keywords comparison if we have data
+            if top_keywords:
+                keywords_list = [kw['keywords'] for kw in top_keywords[:3]]
+                futures['comparison'] = executor.submit(create_keyword_comparison, keywords_list, days)
+            
+            for name, future in futures.items():
+                chart = future.result()
+                if 'chart' in chart:
+                    # Snapshots are built from copies; the sub-chart results stay cached as JSON
+                    dashboard_data['charts'][name] = _chart_to_png(chart) if render == 'png' else chart
         
         return dashboard_data
         
@@ -0,0 +1,29 @@
+import os
+import sys
+
+import pytest
+
+# Tests import the app modules the same way app.py does (config, src.*)
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from config import Config
+
+
+@pytest.fixture
+def data_manager(tmp_path, monkeypatch):
+    """A DataManager backed by a fresh SQLite file"""
+    monkeypatch.setattr(Config, 'DATABASE_PATH', str(tmp_path / 'test.db'))
+    from src.data_manager import DataManager
+    manager = DataManager()
+    yield manager
+    if manager._conn is not None:
+        manager._conn.close()
+
+
+@pytest.fixture
+def news_fetcher(tmp_path, monkeypatch):
+    """A NewsFetcher whose HTTP cache lives in a temporary directory"""
+    monkeypatch.setattr(Config, 'HTTP_CACHE_PATH', str(tmp_path / 'http_cache'))
+    from src.news_fetcher import NewsFetcher
+    with NewsFetcher() as fetcher:
+        yield fetcher
@@ -0,0 +1,63 @@
+def _article(title, source, sentiment='positive', confidence=0.9):
+    return {
+        'title': title,
+        'content': f'{title} content',
+        'url': f'https://example.com/{title}',
+        'source': source,
+        'sentiment': sentiment,
+        'confidence': confidence,
+        'scores': {'positive': 0.8, 'negative': 0.1, 'neutral': 0.1},
+    }
+
+
+def _store_technology(data_manager):
+    data_manager.store_analysis('technology', [
+        _article('a', 'Wire'),
+        _article('b', 'Herald', 'negative', 0.7),
+        _article('c', 'Wire', 'neutral', 0.6),
+    ])
+    data_manager.store_analysis('sports', [_article('d', 'Daily')])
+
+
+def test_keyword_prefix_matches_in_every_query(data_manager):
+    _store_technology(data_manager)
+
+    stats = data_manager.get_summary_stats('tech')
+    assert stats['total_articles'] == 3
+    assert stats['unique_sources'] == 2
+
+    trends = data_manager.get_trends('tech')['trends']
+    assert sum(day['total'] for day in trends) == 3
+
+    batch = data_manager.get_summary_stats_batch(['tech', 'sports'])
+    assert batch['tech']['total_articles'] == 3
+    assert batch['sports']['total_articles'] == 1
+
+    histogram = data_manager.get_confidence_histogram('tech')
+    assert sum(row['article_count'] for row in histogram) == 3
+
+    exported = ''.join(data_manager.export_data('tech', format='csv'))
+    assert exported.count('technology') == 3
+    assert 'sports' not in exported
+
+
+def test_keyword_does_not_match_other_words(data_manager):
+    _store_technology(data_manager)
+
+    assert data_manager.get_summary_stats('nology')['total_articles'] == 0
+    assert data_manager.get_confidence_histogram('nology') == []
+
+
+def test_batch_stats_count_repeated_keywords_once(data_manager):
+    _store_technology(data_manager)
+
+    batch = data_manager.get_summary_stats_batch(['technology', 'technology'])
+    assert batch['technology']['total_articles'] == 3
+
+
+def test_unique_sources_skip_articles_without_source(data_manager):
+    _store_technology(data_manager)
+    data_manager.store_analysis('technology', [_article('e', None), _article('f', '')])
+
+    assert data_manager.get_summary_stats()['unique_sources'] == 3
+    assert data_manager.get_summary_stats('tech')['unique_sources'] == 2
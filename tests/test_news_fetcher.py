@@ -0,0 +1,28 @@
+PAGE_WITH_CHROME = b"""
+<html><body>
+  <header><p>Header promo text</p></header>
+  <nav><p>Home | World | Business</p></nav>
+  <div class="story">
+    <p>Body paragraph one is here.</p>
+    <p>Second paragraph.</p>
+  </div>
+  <aside><p>Related stories</p></aside>
+  <footer><p>Copyright footer junk</p></footer>
+</body></html>
+"""
+
+
+def test_paragraph_fallback_skips_page_chrome(news_fetcher):
+    content = news_fetcher._parse_content(PAGE_WITH_CHROME)
+    assert content == 'Body paragraph one is here. Second paragraph.'
+
+
+def test_article_container_is_preferred(news_fetcher):
+    html = b"""
+    <html><body>
+      <header><p>Header promo text</p></header>
+      <article><p>Story text.</p><footer><p>Share this</p></footer></article>
+      <p>Stray paragraph</p>
+    </body></html>
+    """
+    assert news_fetcher._parse_content(html) == 'Story text.'
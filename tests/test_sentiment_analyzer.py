@@ -0,0 +1,18 @@
+from config import Config
+from src.sentiment_analyzer import PARALLEL_MIN_BATCH, SentimentAnalyzer
+
+
+def test_batch_falls_back_when_textblob_pool_is_gone(monkeypatch):
+    monkeypatch.setattr(Config, 'TEXTBLOB_WORKERS', 1)
+    # Lexicon models only; the transformer downloads are irrelevant here
+    monkeypatch.setattr(SentimentAnalyzer, '_load_available_models', lambda self: None)
+    analyzer = SentimentAnalyzer()
+    analyzer._process_pool.shutdown()
+
+    texts = [f'Markets had a really great day number {n}' for n in range(PARALLEL_MIN_BATCH)]
+    results = analyzer.analyze_batch(texts)
+
+    assert len(results) == len(texts)
+    assert all('textblob' in result.details['models_used'] for result in results)
+    assert analyzer._process_pool is None
+    analyzer.close()
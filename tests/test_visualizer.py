@@ -0,0 +1,26 @@
+import pytest
+
+from src import visualizer
+from test_data_manager import _article
+
+
+@pytest.fixture
+def chart_data(data_manager, monkeypatch):
+    """Point the visualizer at the test database with an empty chart cache"""
+    monkeypatch.setattr(visualizer, '_data_manager', data_manager)
+    visualizer._chart_cache.clear()
+    yield data_manager
+    visualizer._chart_cache.clear()
+
+
+def test_volume_chart_keeps_articles_without_source(chart_data):
+    chart_data.store_analysis('technology', [
+        _article('a', 'Wire'),
+        _article('b', None),
+        _article('c', None),
+    ])
+
+    result = visualizer.create_volume_chart(7)
+
+    totals = {trace['name']: sum(trace['y']) for trace in result['chart']['data']}
+    assert totals == {'Wire': 1, 'Unknown': 2}